@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("dbl-vlog benchmarks")
+    group.addoption(
+        "--bench-sizes",
+        default="1000",
+        help="comma-separated stream sizes, e.g. 1000,100000,10000000 (default: 1000)",
+    )
+    group.addoption("--bench-seed", type=int, default=0, help="generator seed (default: 0)")
+    group.addoption("--bench-fanout", type=int, default=8, help="requests in flight (default: 8)")
+    group.addoption("--bench-payload-depth", type=int, default=2, help="INTENT payload depth (default: 2)")
+    group.addoption("--bench-unicode-share", type=float, default=0.1, help="non-ASCII string share (default: 0.1)")
+    group.addoption(
+        "--bench-no-memory",
+        action="store_true",
+        help="skip the tracemalloc pass that measures peak memory",
+    )
+    group.addoption(
+        "--bench-baseline",
+        default=str(DEFAULT_BASELINE),
+        help="baseline JSON to compare against (default: benchmarks/baseline.json)",
+    )
+    group.addoption("--bench-save-baseline", default=None, help="write results to this baseline JSON")
+    group.addoption(
+        "--bench-max-regression",
+        type=float,
+        default=None,
+        help="fail when ops/s drops by more than this fraction of the baseline (default: report only)",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "size" in metafunc.fixturenames:
+        raw = metafunc.config.getoption("--bench-sizes")
+        sizes = [int(float(s)) for s in raw.split(",") if s.strip()]
+        metafunc.parametrize("size", sizes, ids=[f"n={s}" for s in sizes])
+
+
+class BenchRecorder:
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        self.results: dict[str, dict[str, Any]] = {}
+        path = Path(config.getoption("--bench-baseline"))
+        self.baseline: dict[str, dict[str, Any]] = json.loads(path.read_text()) if path.exists() else {}
+
+    def record(self, key: str, ops: int, seconds: float, peak_bytes: int | None) -> None:
+        ops_s = ops / seconds if seconds > 0 else float("inf")
+        self.results[key] = {"ops": ops, "seconds": seconds, "ops_per_s": ops_s, "peak_bytes": peak_bytes}
+        max_regression = self.config.getoption("--bench-max-regression")
+        base = self.baseline.get(key)
+        if max_regression is not None and base is not None:
+            floor = base["ops_per_s"] * (1.0 - max_regression)
+            assert ops_s >= floor, f"{key}: {ops_s:,.0f} ops/s is below {floor:,.0f} (baseline {base['ops_per_s']:,.0f})"
+
+
+@pytest.fixture(scope="session")
+def bench(request: pytest.FixtureRequest) -> BenchRecorder:
+    recorder = BenchRecorder(request.config)
+    request.config._dbl_bench = recorder  # type: ignore[attr-defined]
+    return recorder
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    recorder: BenchRecorder | None = getattr(config, "_dbl_bench", None)
+    if recorder is None or not recorder.results:
+        return
+    tr = terminalreporter
+    tr.section("dbl-vlog benchmarks")
+    tr.write_line(f"{'benchmark':<52} {'ops/s':>14} {'peak MiB':>10} {'vs baseline':>12}")
+    for key, r in recorder.results.items():
+        peak = "-" if r["peak_bytes"] is None else f"{r['peak_bytes'] / 2**20:.1f}"
+        base = recorder.baseline.get(key)
+        ratio = "-" if base is None else f"{r['ops_per_s'] / base['ops_per_s']:.2f}x"
+        tr.write_line(f"{key:<52} {r['ops_per_s']:>14,.0f} {peak:>10} {ratio:>12}")
+    out = config.getoption("--bench-save-baseline")
+    if out:
+        path = Path(out)
+        merged = json.loads(path.read_text()) if path.exists() else {}
+        merged.update(recorder.results)
+        path.write_text(json.dumps(merged, indent=2, sort_keys=True) + "\n")
+        tr.write_line(f"baseline written to {out}")
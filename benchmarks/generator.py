@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+from dbl_vlog import DblEvent, DblEventKind
+
+
+_ASCII_WORDS = ("alpha", "beta", "gamma", "delta", "order", "refund", "search", "upload")
+# Mix of composed and decomposed forms so NFC normalization has real work to do.
+_UNICODE_WORDS = ("café", "café", "Zürich", "Zürich", "naïve", "東京", "Δέλτα", "emoji-\U0001f600")
+
+
+class StreamGenerator:
+    """
+    Seeded generator of realistic INTENT/DECISION/EXECUTION/PROOF streams.
+
+    - fanout: number of requests in flight at once (correlation-id interleaving)
+    - payload_depth: nesting depth of the INTENT payload
+    - unicode_share: probability that a generated string is non-ASCII
+    - deny_share: probability that a DECISION ends its request
+
+    Every prefix of the generated stream passes verify_ordering (with
+    require_intent_before_decision), verify_identity_fields and
+    verify_deterministic_is_canonicalizable.
+    """
+
+    def __init__(
+        self,
+        *,
+        seed: int = 0,
+        fanout: int = 8,
+        payload_depth: int = 2,
+        unicode_share: float = 0.1,
+        deny_share: float = 0.1,
+    ) -> None:
+        if fanout < 1:
+            raise ValueError("fanout must be >= 1")
+        self.rng = random.Random(seed)
+        self.fanout = fanout
+        self.payload_depth = payload_depth
+        self.unicode_share = unicode_share
+        self.deny_share = deny_share
+        self._next_request = 0
+        self._clock = 1_700_000_000
+        self._boundary_hashes = [self._label() for _ in range(4)]
+        self._policy_digests = [self._label() for _ in range(4)]
+
+    def events(self, n: int) -> Iterator[DblEvent]:
+        active = [self._request() for _ in range(self.fanout)]
+        emitted = 0
+        while emitted < n:
+            slot = self.rng.randrange(len(active))
+            event = next(active[slot], None)
+            if event is None:
+                active[slot] = self._request()
+                continue
+            yield event
+            emitted += 1
+
+    def _request(self) -> Iterator[DblEvent]:
+        corr = f"req-{self._next_request:09d}"
+        self._next_request += 1
+        return self._lifecycle(corr)
+
+    def _lifecycle(self, corr: str) -> Iterator[DblEvent]:
+        rng = self.rng
+        yield DblEvent(
+            kind=DblEventKind.INTENT,
+            deterministic_fields={
+                "correlation_id": corr,
+                "actor": self._word(),
+                "boundary_version": 1,
+                "boundary_config_hash": rng.choice(self._boundary_hashes),
+                "input_digest": self._label(),
+                "payload": self._payload(self.payload_depth),
+            },
+            observational_fields={"received_at": self._timestamp(), "host": "ingest-1"},
+        )
+        deny = rng.random() < self.deny_share
+        yield DblEvent(
+            kind=DblEventKind.DECISION,
+            deterministic_fields={
+                "correlation_id": corr,
+                "policy_version": 3,
+                "policy_digest": rng.choice(self._policy_digests),
+                "outcome": "DENY" if deny else "ALLOW",
+                "reason_codes": ["R1", "R7"] if deny else [],
+            },
+            observational_fields={"decided_at": self._timestamp()},
+        )
+        if deny:
+            return
+        yield DblEvent(
+            kind=DblEventKind.EXECUTION,
+            deterministic_fields={"correlation_id": corr, "status": "ok", "effect": self._word()},
+            observational_fields={"started_at": self._timestamp(), "latency_ms": rng.randrange(1, 500)},
+        )
+        yield DblEvent(
+            kind=DblEventKind.PROOF,
+            deterministic_fields={"correlation_id": corr, "proof_digest": self._label()},
+            observational_fields={"proved_at": self._timestamp()},
+        )
+
+    def _payload(self, depth: int) -> dict[str, Any]:
+        rng = self.rng
+        out: dict[str, Any] = {"n": rng.randrange(1_000_000), "flag": rng.random() < 0.5, "s": self._word()}
+        if depth > 0:
+            out["items"] = [self._word() for _ in range(rng.randrange(1, 4))]
+            out["child"] = self._payload(depth - 1)
+        return out
+
+    def _word(self) -> str:
+        if self.rng.random() < self.unicode_share:
+            return self.rng.choice(_UNICODE_WORDS)
+        return self.rng.choice(_ASCII_WORDS)
+
+    def _label(self) -> str:
+        return f"sha256:{self.rng.getrandbits(256):064x}"
+
+    def _timestamp(self) -> str:
+        self._clock += self.rng.randrange(1, 3)
+        return datetime.fromtimestamp(self._clock, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def generate_stream(n: int, **kwargs: Any) -> tuple[DblEvent, ...]:
+    return tuple(StreamGenerator(**kwargs).events(n))
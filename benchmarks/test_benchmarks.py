@@ -0,0 +1,165 @@
+"""
+Throughput benchmarks for the V hot paths.
+
+Run with `python -m pytest benchmarks -q`; see benchmarks/conftest.py for options.
+"""
+from __future__ import annotations
+
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import pytest
+
+from conftest import BenchRecorder
+from generator import generate_stream
+
+from dbl_vlog import (
+    BehaviorV,
+    DblEvent,
+    VLog,
+    event_canonical_bytes,
+    project_normative,
+    verify_append_only,
+    verify_deterministic_is_canonicalizable,
+    verify_identity_fields,
+    verify_ordering,
+)
+
+
+APPEND_BATCH = 1000
+
+_STREAMS: dict[tuple[Any, ...], tuple[DblEvent, ...]] = {}
+
+
+@pytest.fixture
+def events(request: pytest.FixtureRequest, size: int) -> tuple[DblEvent, ...]:
+    opt = request.config.getoption
+    key = (
+        size,
+        opt("--bench-seed"),
+        opt("--bench-fanout"),
+        opt("--bench-payload-depth"),
+        opt("--bench-unicode-share"),
+    )
+    if key not in _STREAMS:
+        _STREAMS.clear()
+        _STREAMS[key] = generate_stream(
+            size,
+            seed=key[1],
+            fanout=key[2],
+            payload_depth=key[3],
+            unicode_share=key[4],
+        )
+    return _STREAMS[key]
+
+
+def _run(
+    request: pytest.FixtureRequest,
+    bench: BenchRecorder,
+    name: str,
+    size: int,
+    ops: int,
+    fn: Callable[[], object],
+) -> None:
+    repeats = 3 if size <= 100_000 else 1
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+
+    peak: int | None = None
+    if not request.config.getoption("--bench-no-memory"):
+        tracemalloc.start()
+        try:
+            fn()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    bench.record(f"{name}[n={size}]", ops, best, peak)
+
+
+def test_append_behavior_v(request: pytest.FixtureRequest, bench: BenchRecorder, events: tuple[DblEvent, ...], size: int) -> None:
+    base = BehaviorV(events=events)
+    extra = events[:APPEND_BATCH]
+
+    def fn() -> None:
+        v = base
+        for e in extra:
+            v = v.append(e)
+
+    _run(request, bench, "append_behavior_v", size, len(extra), fn)
+
+
+def test_append_vlog(request: pytest.FixtureRequest, bench: BenchRecorder, events: tuple[DblEvent, ...], size: int) -> None:
+    def fn() -> BehaviorV:
+        log = VLog(digest_on_publish=False)
+        for e in events:
+            log.append(e)
+        return log.snapshot()
+
+    _run(request, bench, "append_vlog", size, size, fn)
+
+
+def test_v_digest_cold(request: pytest.FixtureRequest, bench: BenchRecorder, events: tuple[DblEvent, ...], size: int) -> None:
+    _run(request, bench, "v_digest_cold", size, size, lambda: BehaviorV(events=events).digest())
+
+
+def test_event_canonical_bytes(request: pytest.FixtureRequest, bench: BenchRecorder, events: tuple[DblEvent, ...], size: int) -> None:
+    def fn() -> None:
+        for e in events:
+            event_canonical_bytes(e)
+
+    _run(request, bench, "event_canonical_bytes", size, size, fn)
+
+
+def test_verify_append_only(request: pytest.FixtureRequest, bench: BenchRecorder, events: tuple[DblEvent, ...], size: int) -> None:
+    prev_v = BehaviorV(events=events[: size // 2])
+    next_v = BehaviorV(events=events)
+    _run(request, bench, "verify_append_only", size, size // 2, lambda: verify_append_only(prev_v, next_v))
+
+
+def test_verify_ordering(request: pytest.FixtureRequest, bench: BenchRecorder, events: tuple[DblEvent, ...], size: int) -> None:
+    v = BehaviorV(events=events)
+    _run(
+        request,
+        bench,
+        "verify_ordering",
+        size,
+        size,
+        lambda: verify_ordering(v, require_intent_before_decision=True),
+    )
+
+
+def test_verify_identity_fields(request: pytest.FixtureRequest, bench: BenchRecorder, events: tuple[DblEvent, ...], size: int) -> None:
+    v = BehaviorV(events=events)
+    _run(request, bench, "verify_identity_fields", size, size, lambda: verify_identity_fields(v))
+
+
+def test_verify_deterministic_is_canonicalizable(request: pytest.FixtureRequest, bench: BenchRecorder, events: tuple[DblEvent, ...], size: int) -> None:
+    v = BehaviorV(events=events)
+    _run(
+        request,
+        bench,
+        "verify_deterministic_is_canonicalizable",
+        size,
+        size,
+        lambda: verify_deterministic_is_canonicalizable(v),
+    )
+
+
+def test_project_normative(request: pytest.FixtureRequest, bench: BenchRecorder, events: tuple[DblEvent, ...], size: int) -> None:
+    v = BehaviorV(events=events)
+    _run(request, bench, "project_normative", size, size, lambda: project_normative(v))
+
+
+def test_generated_stream_is_valid_and_seeded() -> None:
+    events = generate_stream(2000, seed=7, fanout=16, unicode_share=0.5)
+    v = BehaviorV(events=events)
+    verify_ordering(v, require_intent_before_decision=True)
+    verify_identity_fields(v)
+    verify_deterministic_is_canonicalizable(v)
+    assert generate_stream(2000, seed=7, fanout=16, unicode_share=0.5) == events
+    assert generate_stream(2000, seed=8, fanout=16, unicode_share=0.5) != events
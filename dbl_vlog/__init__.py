@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+from . import instrument
 from .exceptions import (
     AppendOnlyViolation,
     CanonicalizationError,
     DblVlogError,
     IdentityViolation,
     OrderingViolation,
+    PartitionViolation,
 )
-from .model import DblEvent, DblEventKind
+from .model import DblEvent, DblEventKind, FrozenFields
 from .projection import project_normative
 from .verify import (
     verify_append_only,
@@ -15,8 +17,37 @@ from .verify import (
     verify_identity_fields,
     verify_ordering,
 )
-from .v import BehaviorV, append_event
-from .digest import event_canonical_bytes, event_digest, event_digest_hex, v_digest, v_digest_hex
+from .v import BehaviorV, VPrefix, append_event
+from .columnar import ColumnarV, verify_identity_columns, verify_ordering_columns
+from .vlog import VLog
+from .aio import AsyncVLog, IngestStats, StageStats
+from .partition import (
+    PartitionedV,
+    PartitionedVLog,
+    shard_of,
+    verify_partitioned,
+    verify_partitioned_append_only,
+)
+from .shm import SharedV, SharedVSegment, attach_shared, publish_shared
+from .query import ObservationalIndex, select
+from .schema import (
+    CompiledCanonicalizer,
+    EventSchema,
+    infer_schema,
+    register_schema,
+    registered_schema,
+    unregister_schema,
+)
+from .store import EventStore, StoredV, StoreStats
+from .digest import (
+    event_canonical_bytes,
+    event_digest,
+    event_digest_hex,
+    v_digest,
+    partitioned_root_digest,
+    v_digest_buffer,
+    v_digest_hex,
+)
 
 __all__ = [
     "AppendOnlyViolation",
@@ -24,10 +55,40 @@ __all__ = [
     "DblVlogError",
     "IdentityViolation",
     "OrderingViolation",
+    "PartitionViolation",
     "DblEvent",
     "DblEventKind",
+    "FrozenFields",
     "BehaviorV",
+    "VPrefix",
     "append_event",
+    "VLog",
+    "AsyncVLog",
+    "IngestStats",
+    "StageStats",
+    "PartitionedV",
+    "PartitionedVLog",
+    "shard_of",
+    "verify_partitioned",
+    "verify_partitioned_append_only",
+    "SharedV",
+    "SharedVSegment",
+    "publish_shared",
+    "attach_shared",
+    "ColumnarV",
+    "verify_ordering_columns",
+    "verify_identity_columns",
+    "ObservationalIndex",
+    "select",
+    "EventSchema",
+    "CompiledCanonicalizer",
+    "infer_schema",
+    "register_schema",
+    "unregister_schema",
+    "registered_schema",
+    "EventStore",
+    "StoredV",
+    "StoreStats",
     "verify_append_only",
     "verify_deterministic_is_canonicalizable",
     "verify_identity_fields",
@@ -38,4 +99,7 @@ __all__ = [
     "event_canonical_bytes",
     "v_digest",
     "v_digest_hex",
+    "v_digest_buffer",
+    "partitioned_root_digest",
+    "instrument",
 ]
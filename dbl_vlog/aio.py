@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+from . import instrument as _instr
+from .digest import event_canonical_bytes
+from .model import DblEvent
+from .v import BehaviorV
+from .vlog import VLog
+
+
+@dataclass(frozen=True, slots=True)
+class StageStats:
+    """Latency summary of one ingest stage, in seconds."""
+    count: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+
+    @property
+    def mean_s(self) -> float:
+        return self.total_s / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class IngestStats:
+    """
+    Per-stage latencies of AsyncVLog.
+
+    - admission: waiting for a free slot (backpressure)
+    - canonicalize: building canonical bytes in the executor
+    - hash: SHA-256 over canonical bytes in the executor
+    - commit: appending to the underlying VLog in submission order
+    - total: from append() call to assigned stream index
+    """
+    admission: StageStats
+    canonicalize: StageStats
+    hash: StageStats
+    commit: StageStats
+    total: StageStats
+
+
+class _Stage:
+    __slots__ = ("count", "total_s", "max_s")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def add(self, dt: float) -> None:
+        self.count += 1
+        self.total_s += dt
+        if dt > self.max_s:
+            self.max_s = dt
+
+    def freeze(self) -> StageStats:
+        return StageStats(count=self.count, total_s=self.total_s, max_s=self.max_s)
+
+
+def _digest_job(event: DblEvent) -> tuple[bytes, float, float]:
+    """
+    Executor job: event_digest split into its canonicalization and hashing stages.
+    """
+    t0 = perf_counter()
+    b = event_canonical_bytes(event)
+    t1 = perf_counter()
+    if _instr.ACTIVE:
+        _instr.count("bytes_hashed", len(b))
+    d = hashlib.sha256(b).digest()
+    t2 = perf_counter()
+    return d, t1 - t0, t2 - t1
+
+
+class AsyncVLog:
+    """
+    asyncio ingest front end for a VLog.
+
+    Canonicalization and hashing run in an executor (the loop's default
+    executor when none is given). Events are committed to V in the order
+    append() was admitted, regardless of executor completion order. At most
+    max_pending events are in flight; further append() calls wait.
+
+    An event whose digest cannot be computed is not appended; its append()
+    raises the CanonicalizationError, or CancelledError if the executor
+    cancelled the job. Once admitted, an event is committed
+    even if the awaiting task is cancelled.
+    """
+
+    def __init__(
+        self,
+        log: VLog | None = None,
+        *,
+        executor: Executor | None = None,
+        max_pending: int = 1024,
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        self._log = log if log is not None else VLog()
+        self._executor = executor
+        self._slots = asyncio.Semaphore(max_pending)
+        self._queue: asyncio.Queue[tuple[DblEvent, Any, asyncio.Future[int], float]] = asyncio.Queue()
+        self._sequencer: asyncio.Task[None] | None = None
+        self._stages = {
+            name: _Stage() for name in ("admission", "canonicalize", "hash", "commit", "total")
+        }
+
+    @property
+    def log(self) -> VLog:
+        return self._log
+
+    async def append(self, event: DblEvent) -> int:
+        """
+        Digest event off-loop and append it; returns its stream index t(e).
+        """
+        if not isinstance(event, DblEvent):
+            raise TypeError("event must be a DblEvent")
+        loop = asyncio.get_running_loop()
+        if self._sequencer is None or self._sequencer.done():
+            self._sequencer = loop.create_task(self._run())
+
+        t0 = perf_counter()
+        await self._slots.acquire()
+        self._stages["admission"].add(perf_counter() - t0)
+
+        try:
+            work = loop.run_in_executor(self._executor, _digest_job, event)
+        except BaseException:
+            self._slots.release()
+            raise
+        done: asyncio.Future[int] = loop.create_future()
+        self._queue.put_nowait((event, work, done, t0))
+        return await asyncio.shield(done)
+
+    async def flush(self) -> None:
+        """
+        Wait until every admitted event has been committed or rejected.
+        """
+        await self._queue.join()
+
+    def snapshot(self) -> BehaviorV:
+        return self._log.snapshot()
+
+    def stats(self) -> IngestStats:
+        s = self._stages
+        return IngestStats(
+            admission=s["admission"].freeze(),
+            canonicalize=s["canonicalize"].freeze(),
+            hash=s["hash"].freeze(),
+            commit=s["commit"].freeze(),
+            total=s["total"].freeze(),
+        )
+
+    async def aclose(self) -> None:
+        await self.flush()
+        if self._sequencer is not None:
+            self._sequencer.cancel()
+            try:
+                await self._sequencer
+            except asyncio.CancelledError:
+                pass
+            self._sequencer = None
+
+    async def __aenter__(self) -> "AsyncVLog":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    async def _run(self) -> None:
+        while True:
+            event, work, done, t0 = await self._queue.get()
+            try:
+                digest, dt_canon, dt_hash = await work
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    raise
+                # The executor cancelled the job (e.g. shutdown(cancel_futures=True)).
+                done.cancel()
+            except Exception as exc:
+                if not done.done():
+                    done.set_exception(exc)
+            else:
+                self._stages["canonicalize"].add(dt_canon)
+                self._stages["hash"].add(dt_hash)
+                t1 = perf_counter()
+                idx = self._log._append_digested(event, digest)
+                t2 = perf_counter()
+                self._stages["commit"].add(t2 - t1)
+                self._stages["total"].add(t2 - t0)
+                if not done.done():
+                    done.set_result(idx)
+            finally:
+                self._slots.release()
+                self._queue.task_done()
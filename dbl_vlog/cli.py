@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import IO, Iterable, Iterator, Sequence
+
+from .canonical import canonical_json_bytes, enforce_forbidden_keys
+from .digest import _payload
+from .exceptions import DblVlogError
+from .model import DblEvent, DblEventKind
+from .verify import _check_canonicalizable, _check_identity, _OrderingState, _valid_sha256_labels, _LABEL_KEYS
+
+
+STAGES = ("parse", "canonicalize", "identity", "digest", "ordering")
+
+
+@dataclass(slots=True)
+class _Violation:
+    index: int
+    stage: str
+    error: str
+    message: str
+
+
+@dataclass(slots=True)
+class _ChunkResult:
+    """
+    Per-chunk output of the parallel stages.
+
+    rows holds (kind, id value) for the ordering check and digests the event
+    digests, both for every event before the first violation in the chunk.
+    """
+    rows: list[tuple[DblEventKind, object]] = field(default_factory=list)
+    digests: list[bytes] = field(default_factory=list)
+    violation: _Violation | None = None
+    seconds: dict[str, float] = field(default_factory=lambda: dict.fromkeys(STAGES, 0.0))
+
+
+def _parse_record(line: str, line_no: int) -> DblEvent:
+    try:
+        rec = json.loads(line)
+    except ValueError as exc:
+        raise DblVlogError(f"line {line_no}: invalid JSON: {exc}") from None
+    except RecursionError:
+        raise DblVlogError(f"line {line_no}: invalid JSON: nesting too deep") from None
+    if not isinstance(rec, dict):
+        raise DblVlogError(f"line {line_no}: record must be a JSON object")
+    try:
+        kind = DblEventKind(rec.get("kind"))
+    except ValueError:
+        raise DblVlogError(f"line {line_no}: unknown event kind {rec.get('kind')!r}") from None
+    det = rec.get("deterministic_fields", {})
+    obs = rec.get("observational_fields", {})
+    if not isinstance(det, dict) or not isinstance(obs, dict):
+        raise DblVlogError(f"line {line_no}: field maps must be JSON objects")
+    return DblEvent(kind=kind, deterministic_fields=det, observational_fields=obs)
+
+
+def _process_chunk(start: int, lines: list[tuple[int, str]], id_key: str) -> _ChunkResult:
+    """
+    Parse, canonicalization check, identity check and event digest for one chunk.
+
+    Runs in worker processes with --jobs > 1.
+    """
+    out = _ChunkResult()
+    sec = out.seconds
+
+    t0 = perf_counter()
+    events: list[DblEvent] = []
+    for line_no, line in lines:
+        try:
+            events.append(_parse_record(line, line_no))
+        except DblVlogError as exc:
+            out.violation = _Violation(start + len(events), "parse", type(exc).__name__, str(exc))
+            break
+    sec["parse"] += perf_counter() - t0
+
+    valid_labels = _valid_sha256_labels(
+        event.deterministic_fields.get(k) for event in events for k in _LABEL_KEYS
+    )
+
+    def is_valid(value: object) -> bool:
+        return isinstance(value, str) and value in valid_labels
+
+    for offset, event in enumerate(events):
+        idx = start + offset
+        stage = "canonicalize"
+        t0 = perf_counter()
+        try:
+            canonical = _check_canonicalizable(event, idx)
+            t1 = perf_counter()
+            sec["canonicalize"] += t1 - t0
+            stage = "identity"
+            _check_identity(event, idx, id_key=id_key, is_valid=is_valid)
+            t2 = perf_counter()
+            sec["identity"] += t2 - t1
+            stage = "digest"
+            enforce_forbidden_keys(event.deterministic_fields)
+            digest = hashlib.sha256(canonical_json_bytes(_payload(event.kind, canonical))).digest()
+            sec["digest"] += perf_counter() - t2
+        except DblVlogError as exc:
+            out.violation = _Violation(idx, stage, type(exc).__name__, str(exc))
+            break
+        except (UnicodeEncodeError, RecursionError) as exc:
+            # Valid JSON the canonical form cannot represent: lone surrogates,
+            # nesting deeper than canonicalize_value can recurse.
+            out.violation = _Violation(
+                idx,
+                stage,
+                "CanonicalizationError",
+                f"deterministic_fields not canonicalizable ({type(exc).__name__}); "
+                f"kind={event.kind.value} index={idx}",
+            )
+            break
+        out.rows.append((event.kind, event.deterministic_fields.get(id_key)))
+        out.digests.append(digest)
+    return out
+
+
+def _chunks(stream: IO[str], chunk_size: int) -> Iterator[tuple[int, list[tuple[int, str]]]]:
+    start = 0
+    chunk: list[tuple[int, str]] = []
+    for line_no, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        chunk.append((line_no, line))
+        if len(chunk) >= chunk_size:
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def _results(
+    chunks: Iterable[tuple[int, list[tuple[int, str]]]],
+    id_key: str,
+    jobs: int,
+) -> Iterator[_ChunkResult]:
+    if jobs <= 1:
+        for start, lines in chunks:
+            yield _process_chunk(start, lines, id_key)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        window: deque[Future[_ChunkResult]] = deque()
+        for start, lines in chunks:
+            window.append(pool.submit(_process_chunk, start, lines, id_key))
+            if len(window) >= 2 * jobs:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="dbl-vlog",
+        description=(
+            "Stream a V from JSONL, run verify_deterministic_is_canonicalizable, "
+            "verify_identity_fields and verify_ordering, and print the V digest."
+        ),
+        epilog=(
+            "Each line is a JSON object with 'kind', 'deterministic_fields' and "
+            "'observational_fields'. Blank lines are skipped. Exit status: 0 valid, "
+            "1 violation, 2 usage or I/O error."
+        ),
+    )
+    p.add_argument("path", help="JSONL file, or '-' for stdin")
+    p.add_argument("-j", "--jobs", type=int, default=1, help="worker processes for parse/verify/digest (default: 1)")
+    p.add_argument("--chunk-size", type=int, default=4096, help="events per work unit (default: 4096)")
+    p.add_argument("--id-key", default="correlation_id", help="per-request key (default: correlation_id)")
+    p.add_argument("--require-intent-before-decision", action="store_true")
+    p.add_argument(
+        "--allow-decision-after-execution",
+        action="store_true",
+        help="disable the DECISION-after-EXECUTION/PROOF rejection",
+    )
+    p.add_argument("--max-decisions-per-id", type=int, default=1, help="0 disables the limit (default: 1)")
+    p.add_argument("-q", "--quiet", action="store_true", help="do not print per-stage throughput")
+    return p
+
+
+def run(args: argparse.Namespace, stream: IO[str], out: IO[str], err: IO[str]) -> int:
+    ordering = _OrderingState(
+        id_key=args.id_key,
+        require_intent_before_decision=args.require_intent_before_decision,
+        disallow_decision_after_execution=not args.allow_decision_after_execution,
+        max_decisions_per_id=args.max_decisions_per_id,
+    )
+    seconds = dict.fromkeys(STAGES, 0.0)
+    h = hashlib.sha256()
+    count = 0
+    violation: _Violation | None = None
+    t_start = perf_counter()
+
+    for result in _results(_chunks(stream, args.chunk_size), args.id_key, args.jobs):
+        for stage, dt in result.seconds.items():
+            seconds[stage] += dt
+        t0 = perf_counter()
+        for (kind, id_value), digest in zip(result.rows, result.digests):
+            try:
+                ordering.check(kind, id_value, count)
+            except DblVlogError as exc:
+                violation = _Violation(count, "ordering", type(exc).__name__, str(exc))
+                break
+            h.update(count.to_bytes(8, byteorder="big", signed=False))
+            h.update(digest)
+            count += 1
+        seconds["ordering"] += perf_counter() - t0
+        if violation is None:
+            violation = result.violation
+        if violation is not None:
+            break
+
+    wall = perf_counter() - t_start
+    if not args.quiet:
+        for stage in STAGES:
+            dt = seconds[stage]
+            rate = f"{count / dt:,.0f} ev/s" if dt > 0 else "-"
+            err.write(f"{stage:<13} {dt:9.3f}s  {rate}\n")
+        rate = f"{count / wall:,.0f} ev/s" if wall > 0 else "-"
+        err.write(f"{'total (wall)':<13} {wall:9.3f}s  {rate}  jobs={args.jobs}\n")
+
+    if violation is not None:
+        out.write(
+            f"violation stage={violation.stage} index={violation.index} "
+            f"{violation.error}: {violation.message}\n"
+        )
+        return 1
+    out.write(f"ok events={count} digest={h.hexdigest()}\n")
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.jobs < 1 or args.chunk_size < 1:
+        sys.stderr.write("dbl-vlog: --jobs and --chunk-size must be >= 1\n")
+        return 2
+    try:
+        if args.path == "-":
+            return run(args, sys.stdin, sys.stdout, sys.stderr)
+        with open(args.path, encoding="utf-8") as stream:
+            return run(args, stream, sys.stdout, sys.stderr)
+    except OSError as exc:
+        sys.stderr.write(f"dbl-vlog: {exc}\n")
+        return 2
+    except UnicodeDecodeError as exc:
+        sys.stderr.write(f"dbl-vlog: {args.path}: input is not valid UTF-8: {exc}\n")
+        return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
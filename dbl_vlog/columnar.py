@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import Any, Iterable, Tuple
+
+from . import instrument as _instr
+from .canonical import canonicalize_value
+from .digest import event_digest, v_digest_buffer
+from .exceptions import IdentityViolation, OrderingViolation
+from .model import DblEvent, DblEventKind
+from .v import BehaviorV
+from .verify import _is_sha256_label
+
+
+KIND_CODES: Tuple[DblEventKind, ...] = tuple(DblEventKind)
+_KIND_TO_CODE = {k: i for i, k in enumerate(KIND_CODES)}
+_INTENT = _KIND_TO_CODE[DblEventKind.INTENT]
+_DECISION = _KIND_TO_CODE[DblEventKind.DECISION]
+_EXECUTION = _KIND_TO_CODE[DblEventKind.EXECUTION]
+_PROOF = _KIND_TO_CODE[DblEventKind.PROOF]
+
+# Identity flag bits, one uint16 per row.
+HAS_BOUNDARY_VERSION = 1 << 0
+HAS_BOUNDARY_CONFIG_HASH = 1 << 1
+VALID_BOUNDARY_CONFIG_HASH = 1 << 2
+HAS_INTENT_DIGEST = 1 << 3
+VALID_INTENT_DIGEST = 1 << 4
+HAS_INPUT_DIGEST = 1 << 5
+VALID_INPUT_DIGEST = 1 << 6
+HAS_POLICY_VERSION = 1 << 7
+HAS_POLICY_DIGEST = 1 << 8
+VALID_POLICY_DIGEST = 1 << 9
+
+
+def _identity_flags(fields: Mapping[str, Any]) -> int:
+    get = fields.get
+    flags = 0
+    if "boundary_version" in fields:
+        flags |= HAS_BOUNDARY_VERSION
+    if "boundary_config_hash" in fields:
+        flags |= HAS_BOUNDARY_CONFIG_HASH
+    if _is_sha256_label(get("boundary_config_hash")):
+        flags |= VALID_BOUNDARY_CONFIG_HASH
+    for key, has, valid in (
+        ("intent_digest", HAS_INTENT_DIGEST, VALID_INTENT_DIGEST),
+        ("input_digest", HAS_INPUT_DIGEST, VALID_INPUT_DIGEST),
+        ("policy_digest", HAS_POLICY_DIGEST, VALID_POLICY_DIGEST),
+    ):
+        value = get(key)
+        if value is not None:
+            flags |= has
+            if _is_sha256_label(value):
+                flags |= valid
+    if "policy_version" in fields:
+        flags |= HAS_POLICY_VERSION
+    return flags
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnarV:
+    """
+    Struct-of-arrays representation of V for analytics-scale streams.
+
+    Columns (one row per event, row index is t(e)):
+    - kinds: one byte per row, index into KIND_CODES
+    - ids: int64 index into id_table, -1 if id_key is not a string
+    - identity: uint16 identity flag bits
+    - digests: contiguous 32-byte event digests
+
+    id_table holds NFC-normalized id strings. events optionally keeps the
+    source events so the stream can be converted back to BehaviorV.
+    """
+    kinds: bytes
+    ids: memoryview
+    id_table: Tuple[str, ...]
+    identity: memoryview
+    digests: bytes
+    id_key: str = "correlation_id"
+    events: Tuple[DblEvent, ...] | None = None
+
+    @classmethod
+    def from_events(
+        cls,
+        events: Iterable[DblEvent],
+        *,
+        id_key: str = "correlation_id",
+        keep_events: bool = False,
+    ) -> "ColumnarV":
+        """
+        Build columns in one pass over events without materializing a BehaviorV.
+
+        Raises CanonicalizationError if an event digest cannot be computed.
+        """
+        kinds = bytearray()
+        ids = array("q")
+        identity = array("H")
+        digests = bytearray()
+        table: dict[str, int] = {}
+        kept: list[DblEvent] | None = [] if keep_events else None
+
+        for event in events:
+            fields = event.deterministic_fields
+            kinds.append(_KIND_TO_CODE[event.kind])
+            corr = fields.get(id_key)
+            if isinstance(corr, str):
+                label = canonicalize_value(corr)
+                ref = table.get(label)
+                if ref is None:
+                    ref = table.setdefault(label, len(table))
+                ids.append(ref)
+            else:
+                ids.append(-1)
+            identity.append(_identity_flags(fields))
+            digests += event_digest(event)
+            if kept is not None:
+                kept.append(event)
+
+        return cls(
+            kinds=bytes(kinds),
+            ids=memoryview(ids.tobytes()).cast("q"),
+            id_table=tuple(table),
+            identity=memoryview(identity.tobytes()).cast("H"),
+            digests=bytes(digests),
+            id_key=id_key,
+            events=tuple(kept) if kept is not None else None,
+        )
+
+    @classmethod
+    def from_v(cls, v: BehaviorV, *, id_key: str = "correlation_id", keep_events: bool = True) -> "ColumnarV":
+        return cls.from_events(v.events, id_key=id_key, keep_events=keep_events)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def kind_at(self, index: int) -> DblEventKind:
+        return KIND_CODES[self.kinds[index]]
+
+    def id_at(self, index: int) -> str | None:
+        ref = self.ids[index]
+        return None if ref < 0 else self.id_table[ref]
+
+    def event_digest_at(self, index: int) -> bytes:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+        return self.digests[index * 32 : index * 32 + 32]
+
+    def event_digests(self) -> list[bytes]:
+        return [self.digests[off : off + 32] for off in range(0, len(self.digests), 32)]
+
+    def digest(self) -> bytes:
+        return v_digest_buffer(self.digests)
+
+    def digest_hex(self) -> str:
+        return self.digest().hex()
+
+    def to_v(self) -> BehaviorV:
+        if self.events is None:
+            raise ValueError("ColumnarV was built without keep_events; cannot convert to BehaviorV")
+        return BehaviorV(events=self.events)
+
+
+@_instr.timed("verify_ordering_columns")
+def verify_ordering_columns(
+    cv: ColumnarV,
+    *,
+    require_intent_before_decision: bool = False,
+    disallow_decision_after_execution: bool = True,
+    max_decisions_per_id: int = 1,
+) -> None:
+    """
+    Column equivalent of verify_ordering, using cv.id_key.
+
+    Raises the same OrderingViolation messages at the same indices.
+    """
+    id_key = cv.id_key
+    table = cv.id_table
+    empty_ref = -1
+    for ref, label in enumerate(table):
+        if label == "":
+            empty_ref = ref
+            break
+
+    seen_intent: set[int] = set()
+    seen_decision: dict[int, int] = {}
+    seen_execution: set[int] = set()
+
+    for idx, (code, ref) in enumerate(zip(cv.kinds, cv.ids)):
+        if ref < 0 or ref == empty_ref:
+            raise OrderingViolation(
+                f"missing {id_key} in deterministic_fields; kind={KIND_CODES[code].value} index={idx}"
+            )
+
+        if code == _INTENT:
+            seen_intent.add(ref)
+            continue
+
+        if code == _DECISION:
+            if require_intent_before_decision and ref not in seen_intent:
+                raise OrderingViolation(
+                    f"DECISION observed before INTENT for {id_key}={table[ref]}; index={idx}"
+                )
+            if disallow_decision_after_execution and ref in seen_execution:
+                raise OrderingViolation(
+                    f"DECISION observed after EXECUTION/PROOF for {id_key}={table[ref]}; index={idx}"
+                )
+            count = seen_decision.get(ref, 0) + 1
+            if max_decisions_per_id > 0 and count > max_decisions_per_id:
+                raise OrderingViolation(
+                    f"DECISION count exceeds {max_decisions_per_id} for {id_key}={table[ref]}; index={idx}"
+                )
+            seen_decision[ref] = count
+            continue
+
+        if code == _EXECUTION or code == _PROOF:
+            if ref not in seen_decision:
+                raise OrderingViolation(
+                    f"{KIND_CODES[code].value} observed before DECISION for {id_key}={table[ref]}; index={idx}"
+                )
+            seen_execution.add(ref)
+
+
+@_instr.timed("verify_identity_columns")
+def verify_identity_columns(cv: ColumnarV) -> None:
+    """
+    Column equivalent of verify_identity_fields, using cv.id_key.
+
+    Raises the same IdentityViolation messages at the same indices.
+    """
+    id_key = cv.id_key
+    table = cv.id_table
+    for idx, (code, flags) in enumerate(zip(cv.kinds, cv.identity)):
+        if code == _INTENT:
+            if flags & (HAS_BOUNDARY_VERSION | HAS_BOUNDARY_CONFIG_HASH) != (
+                HAS_BOUNDARY_VERSION | HAS_BOUNDARY_CONFIG_HASH
+            ):
+                missing = [
+                    k for k, bit in (
+                        ("boundary_version", HAS_BOUNDARY_VERSION),
+                        ("boundary_config_hash", HAS_BOUNDARY_CONFIG_HASH),
+                    )
+                    if not flags & bit
+                ]
+                raise IdentityViolation(
+                    f"INTENT missing deterministic identity fields: {missing}; "
+                    f"{id_key}={_label(cv, idx, table)} index={idx}"
+                )
+            if not flags & VALID_BOUNDARY_CONFIG_HASH:
+                raise IdentityViolation(
+                    f"INTENT has invalid boundary_config_hash; {id_key}={_label(cv, idx, table)} index={idx}"
+                )
+            if flags & HAS_INTENT_DIGEST and not flags & VALID_INTENT_DIGEST:
+                raise IdentityViolation(
+                    f"INTENT has invalid intent_digest; {id_key}={_label(cv, idx, table)} index={idx}"
+                )
+            if flags & HAS_INPUT_DIGEST and not flags & VALID_INPUT_DIGEST:
+                raise IdentityViolation(
+                    f"INTENT has invalid input_digest; {id_key}={_label(cv, idx, table)} index={idx}"
+                )
+            if not flags & (HAS_INTENT_DIGEST | HAS_INPUT_DIGEST):
+                raise IdentityViolation(
+                    "INTENT missing input_digest or intent_digest; "
+                    f"{id_key}={_label(cv, idx, table)} index={idx}"
+                )
+        elif code == _DECISION:
+            if flags & HAS_POLICY_DIGEST and not flags & VALID_POLICY_DIGEST:
+                raise IdentityViolation(
+                    "DECISION has invalid policy_digest; "
+                    f"{id_key}={_label(cv, idx, table)} index={idx}"
+                )
+            if not flags & (HAS_POLICY_VERSION | HAS_POLICY_DIGEST):
+                raise IdentityViolation(
+                    "DECISION missing policy_version or policy_digest; "
+                    f"{id_key}={_label(cv, idx, table)} index={idx}"
+                )
+
+
+def _label(cv: ColumnarV, index: int, table: Tuple[str, ...]) -> str:
+    ref = cv.ids[index]
+    return "unknown" if ref < 0 else table[ref]
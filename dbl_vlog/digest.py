@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Any
+from typing import Any, Callable
 
+from . import instrument as _instr
 from .canonical import canonical_json_bytes, canonicalize_value, enforce_forbidden_keys
-from .model import DblEvent
+from .model import DblEvent, DblEventKind
 
 
 SCHEMA_VERSION = 1
 
+# Schema-compiled canonicalizers per event kind, managed by dbl_vlog.schema.
+# Each returns canonical bytes, or None to fall back to the generic path.
+_COMPILED: dict[DblEventKind, Callable[[DblEvent, bool], bytes | None]] = {}
+
 
 def event_digest_payload(event: DblEvent, *, enforce_keys: bool = True) -> dict[str, Any]:
     """
@@ -20,21 +25,27 @@ def event_digest_payload(event: DblEvent, *, enforce_keys: bool = True) -> dict[
     """
     if enforce_keys:
         enforce_forbidden_keys(event.deterministic_fields)
+    if _instr.ACTIVE:
+        _instr.count("events_canonicalized")
+
+    return _payload(event.kind, canonicalize_value(event.deterministic_fields))
 
-    payload = {
+
+def _payload(kind: DblEventKind, canonical_fields: Any) -> dict[str, Any]:
+    return {
         "schema_version": SCHEMA_VERSION,
-        "kind": event.kind.value,
-        "deterministic_fields": canonicalize_value(event.deterministic_fields),
+        "kind": kind.value,
+        "deterministic_fields": canonical_fields,
     }
-    return payload
 
 
 def event_digest(event: DblEvent, *, enforce_keys: bool = True) -> bytes:
     """
     SHA-256 over canonical JSON bytes of the digest payload.
     """
-    payload = event_digest_payload(event, enforce_keys=enforce_keys)
-    b = canonical_json_bytes(payload)
+    b = event_canonical_bytes(event, enforce_keys=enforce_keys)
+    if _instr.ACTIVE:
+        _instr.count("bytes_hashed", len(b))
     return hashlib.sha256(b).digest()
 
 
@@ -46,6 +57,12 @@ def event_canonical_bytes(event: DblEvent, *, enforce_keys: bool = True) -> byte
     """
     Canonical JSON bytes of the digest payload, without hashing.
     """
+    if _COMPILED:
+        compiled = _COMPILED.get(event.kind)
+        if compiled is not None:
+            b = compiled(event, enforce_keys)
+            if b is not None:
+                return b
     payload = event_digest_payload(event, enforce_keys=enforce_keys)
     return canonical_json_bytes(payload)
 
@@ -67,8 +84,55 @@ def v_digest(event_digests: list[bytes]) -> bytes:
             raise ValueError("event digest must be 32 bytes (sha256)")
         h.update(idx.to_bytes(8, byteorder="big", signed=False))
         h.update(d)
+    if _instr.ACTIVE:
+        _instr.count("bytes_hashed", 40 * len(event_digests))
     return h.digest()
 
 
 def v_digest_hex(event_digests: list[bytes]) -> str:
     return v_digest(event_digests).hex()
+
+
+def v_digest_buffer(buf: bytes | bytearray | memoryview) -> bytes:
+    """
+    v_digest over a contiguous buffer of concatenated 32-byte event digests.
+
+    Produces the same bytes as v_digest on the split list.
+    """
+    mv = memoryview(buf).cast("B")
+    if len(mv) % 32 != 0:
+        raise ValueError("event digest buffer length must be a multiple of 32")
+    h = hashlib.sha256()
+    for idx, off in enumerate(range(0, len(mv), 32)):
+        h.update(idx.to_bytes(8, byteorder="big", signed=False))
+        h.update(mv[off : off + 32])
+    if _instr.ACTIVE:
+        _instr.count("bytes_hashed", len(mv) // 32 * 40)
+    return h.digest()
+
+
+PARTITION_ROOT_TAG = b"dbl-vlog/partitioned-v/1"
+
+
+def partitioned_root_digest(shard_digests: list[bytes], shard_lengths: list[int]) -> bytes:
+    """
+    Root digest of a partitioned V over its ordered shards.
+
+      H( tag || n || (j || len_j || D_j) for j=0..n-1 )
+
+    Where:
+    - tag is PARTITION_ROOT_TAG
+    - n, j and len_j are uint64 big-endian
+    - D_j is the 32-byte v_digest of shard j
+    """
+    if len(shard_digests) != len(shard_lengths):
+        raise ValueError("shard_digests and shard_lengths must have the same length")
+    h = hashlib.sha256(PARTITION_ROOT_TAG)
+    h.update(len(shard_digests).to_bytes(8, byteorder="big", signed=False))
+    for idx, (d, n) in enumerate(zip(shard_digests, shard_lengths)):
+        if len(d) != 32:
+            raise ValueError("shard digest must be 32 bytes (sha256)")
+        h.update(idx.to_bytes(8, byteorder="big", signed=False))
+        h.update(n.to_bytes(8, byteorder="big", signed=False))
+        h.update(d)
+    return h.digest()
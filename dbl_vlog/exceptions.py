@@ -19,3 +19,7 @@ class OrderingViolation(DblVlogError):
 
 class IdentityViolation(DblVlogError):
     """Raised when required deterministic identity fields are missing."""
+
+
+class PartitionViolation(DblVlogError):
+    """Raised when an event is stored in a shard its correlation id does not route to."""
@@ -0,0 +1,134 @@
+"""
+Opt-in instrumentation of canonicalization, hashing and verification.
+
+Disabled by default; hot paths only test the module-level ACTIVE flag.
+Instrumentation is observation-only: hook failures are swallowed and nothing
+recorded here is read back by canonicalization or digest code.
+
+Counters:
+- events_canonicalized: digest payloads built (event_digest, event_canonical_bytes)
+- bytes_hashed: bytes fed to SHA-256 for event and V digests
+- nfc_normalized / nfc_skipped: strings normalized vs. ASCII strings passed through
+- digest_cache_hits / digest_cache_misses: BehaviorV event digest cache lookups
+
+Timers (seconds), one per verifier function name.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, TypeVar
+
+
+ACTIVE = False
+
+COUNTERS = (
+    "events_canonicalized",
+    "bytes_hashed",
+    "nfc_normalized",
+    "nfc_skipped",
+    "digest_cache_hits",
+    "digest_cache_misses",
+)
+
+Hook = Callable[[str, float], None]
+F = TypeVar("F", bound=Callable[..., Any])
+
+_lock = threading.Lock()
+_counters: dict[str, int] = dict.fromkeys(COUNTERS, 0)
+_timers: dict[str, list[float]] = {}
+_hooks: list[Hook] = []
+
+
+@dataclass(frozen=True, slots=True)
+class TimerStats:
+    count: int = 0
+    total_s: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class InstrumentStats:
+    counters: Mapping[str, int] = field(default_factory=dict)
+    timers: Mapping[str, TimerStats] = field(default_factory=dict)
+
+
+def enable() -> None:
+    global ACTIVE
+    ACTIVE = True
+
+
+def disable() -> None:
+    global ACTIVE
+    ACTIVE = False
+
+
+def reset() -> None:
+    with _lock:
+        for name in _counters:
+            _counters[name] = 0
+        _timers.clear()
+
+
+def snapshot() -> InstrumentStats:
+    with _lock:
+        counters = dict(_counters)
+        timers = {name: TimerStats(count=int(c), total_s=t) for name, (c, t) in _timers.items()}
+    return InstrumentStats(counters=MappingProxyType(counters), timers=MappingProxyType(timers))
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Register hook(name, value), called for every counter increment and timer sample.
+    """
+    with _lock:
+        _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    with _lock:
+        _hooks.remove(hook)
+
+
+def count(name: str, n: int = 1) -> None:
+    with _lock:
+        _counters[name] += n
+        hooks = tuple(_hooks)
+    _notify(hooks, name, n)
+
+
+def record_time(name: str, seconds: float) -> None:
+    with _lock:
+        entry = _timers.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        hooks = tuple(_hooks)
+    _notify(hooks, name, seconds)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Decorator recording wall time of each call under name while ACTIVE.
+    """
+    def decorate(fn: F) -> F:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not ACTIVE:
+                return fn(*args, **kwargs)
+            t0 = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record_time(name, perf_counter() - t0)
+        return wrapper  # type: ignore[return-value]
+    return decorate
+
+
+def _notify(hooks: tuple[Hook, ...], name: str, value: float) -> None:
+    for hook in hooks:
+        try:
+            hook(name, value)
+        except Exception:
+            pass
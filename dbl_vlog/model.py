@@ -3,8 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
 from collections.abc import Mapping
-from types import MappingProxyType
-from typing import Any
+from typing import Any, Iterable, Iterator, Tuple
+from weakref import WeakValueDictionary
 
 
 class DblEventKind(str, Enum):
@@ -17,6 +17,102 @@ class DblEventKind(str, Enum):
 JsonMap = Mapping[str, Any]
 
 
+class _Layout:
+    """Key layout shared by all FrozenFields with the same keys in the same order."""
+    __slots__ = ("keys", "index", "__weakref__")
+
+    def __init__(self, keys: Tuple[str, ...]) -> None:
+        self.keys = keys
+        self.index = {k: i for i, k in enumerate(keys)}
+
+
+_LAYOUTS: "WeakValueDictionary[Tuple[str, ...], _Layout]" = WeakValueDictionary()
+
+
+def _layout_for(keys: Tuple[str, ...]) -> _Layout:
+    layout = _LAYOUTS.get(keys)
+    if layout is None:
+        layout = _LAYOUTS.setdefault(keys, _Layout(keys))
+    return layout
+
+
+class FrozenFields(Mapping[str, Any]):
+    """
+    Compact immutable mapping used for event field maps.
+
+    Keys live in a layout shared across all instances of the same shape; each
+    instance stores only a tuple of values. Equality follows Mapping semantics,
+    so a FrozenFields compares equal to a dict with the same items.
+    The hash is computed on first use and cached; it requires hashable values.
+
+    Instances are built in __new__ and reject attribute assignment, since
+    DblEvent adopts them without a defensive copy.
+    """
+    __slots__ = ("_layout", "_values", "_hash")
+
+    _layout: _Layout
+    _values: Tuple[Any, ...]
+    _hash: int | None
+
+    def __new__(cls, data: Mapping[str, Any] | Iterable[Tuple[str, Any]] = ()) -> "FrozenFields":
+        self = super().__new__(cls)
+        if isinstance(data, FrozenFields):
+            layout, values = data._layout, data._values
+        else:
+            items = dict(data)
+            layout, values = _layout_for(tuple(items)), tuple(items.values())
+        object.__setattr__(self, "_layout", layout)
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_hash", None)
+        return self
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("FrozenFields is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("FrozenFields is immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._layout.index[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout.keys)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._layout.index
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = self._layout.index.get(key)
+        if i is None:
+            return default
+        return self._values[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenFields):
+            if self._layout.keys == other._layout.keys:
+                return self._values == other._values
+            return dict(self.items()) == dict(other.items())
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            h = hash(frozenset(zip(self._layout.keys, self._values)))
+            object.__setattr__(self, "_hash", h)
+        return h
+
+    def __repr__(self) -> str:
+        return f"FrozenFields({dict(self.items())!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (FrozenFields, (dict(self.items()),))
+
+
 @dataclass(frozen=True, slots=True)
 class DblEvent:
     """
@@ -24,6 +120,8 @@ class DblEvent:
 
     - deterministic_fields participate in digests
     - observational_fields are excluded from digests and normative projections
+
+    Field maps are stored as FrozenFields; a FrozenFields argument is adopted as is.
     """
     kind: DblEventKind
     deterministic_fields: Mapping[str, Any] = field(default_factory=dict)
@@ -34,13 +132,15 @@ class DblEvent:
             raise TypeError("deterministic_fields must be a mapping[str, Any]")
         if not isinstance(self.observational_fields, Mapping):
             raise TypeError("observational_fields must be a mapping[str, Any]")
-        object.__setattr__(
-            self,
-            "deterministic_fields",
-            MappingProxyType(dict(self.deterministic_fields)),
-        )
-        object.__setattr__(
-            self,
-            "observational_fields",
-            MappingProxyType(dict(self.observational_fields)),
-        )
+        if not isinstance(self.deterministic_fields, FrozenFields):
+            object.__setattr__(
+                self,
+                "deterministic_fields",
+                FrozenFields(self.deterministic_fields),
+            )
+        if not isinstance(self.observational_fields, FrozenFields):
+            object.__setattr__(
+                self,
+                "observational_fields",
+                FrozenFields(self.observational_fields),
+            )
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Tuple
+
+from .canonical import canonicalize_value
+from .digest import partitioned_root_digest
+from .exceptions import AppendOnlyViolation, OrderingViolation, PartitionViolation
+from .model import DblEvent
+from .v import BehaviorV
+from .verify import _require_id, _require_id_value, verify_append_only, verify_ordering
+from .vlog import VLog
+
+
+def shard_of(id_value: str, shards: int) -> int:
+    """
+    Shard index of a per-request id: first 8 bytes of SHA-256(NFC(id)) mod shards.
+    """
+    if shards < 1:
+        raise ValueError("shards must be >= 1")
+    h = hashlib.sha256(str(canonicalize_value(id_value)).encode("utf-8")).digest()
+    return int.from_bytes(h[:8], byteorder="big", signed=False) % shards
+
+
+def _routing_id(event: DblEvent, id_key: str, index_of: Callable[[], int]) -> str:
+    """
+    _require_id for routing; the stream index is computed only for the error.
+    """
+    value = event.deterministic_fields.get(id_key)
+    if isinstance(value, str) and value:
+        return str(canonicalize_value(value))
+    return _require_id_value(event.kind, value, id_key=id_key, index=index_of())
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionedV:
+    """
+    V split into independent BehaviorV shards routed by id_key.
+
+    All events of one request live in one shard, so per-request ordering is
+    preserved within shards. Shards can be appended to and digested
+    independently; root_digest() commits to every shard digest and length.
+    """
+    shards: Tuple[BehaviorV, ...]
+    id_key: str = "correlation_id"
+
+    def __post_init__(self) -> None:
+        if not self.shards:
+            raise ValueError("PartitionedV needs at least one shard")
+
+    @classmethod
+    def empty(cls, shards: int, *, id_key: str = "correlation_id") -> "PartitionedV":
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        return cls(shards=tuple(BehaviorV() for _ in range(shards)), id_key=id_key)
+
+    @classmethod
+    def from_events(
+        cls,
+        events: Iterable[DblEvent],
+        shards: int,
+        *,
+        id_key: str = "correlation_id",
+    ) -> "PartitionedV":
+        """
+        Partition events, keeping their relative order within each shard.
+        """
+        buckets: list[list[DblEvent]] = [[] for _ in range(shards)]
+        for idx, event in enumerate(events):
+            corr = _require_id(event, id_key=id_key, index=idx)
+            buckets[shard_of(corr, shards)].append(event)
+        return cls(shards=tuple(BehaviorV(events=tuple(b)) for b in buckets), id_key=id_key)
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self.shards)
+
+    def __iter__(self) -> Iterator[DblEvent]:
+        for shard in self.shards:
+            yield from shard
+
+    def __repr__(self) -> str:
+        return f"PartitionedV(shards={len(self.shards)}, len={len(self)})"
+
+    def route(self, event: DblEvent) -> int:
+        corr = _routing_id(event, self.id_key, self.__len__)
+        return shard_of(corr, len(self.shards))
+
+    def append(self, event: DblEvent) -> "PartitionedV":
+        j = self.route(event)
+        shards = list(self.shards)
+        shards[j] = shards[j].append(event)
+        return PartitionedV(shards=tuple(shards), id_key=self.id_key)
+
+    def shard_digests(self, *, executor: Executor | None = None) -> list[bytes]:
+        if executor is None:
+            return [s.digest() for s in self.shards]
+        return list(executor.map(BehaviorV.digest, self.shards))
+
+    def root_digest(self, *, executor: Executor | None = None) -> bytes:
+        return partitioned_root_digest(
+            self.shard_digests(executor=executor),
+            [len(s) for s in self.shards],
+        )
+
+    def root_digest_hex(self, *, executor: Executor | None = None) -> str:
+        return self.root_digest(executor=executor).hex()
+
+    def merged(self) -> BehaviorV:
+        """
+        Deterministic merge into one V: shard 0 events, then shard 1, and so on.
+
+        Per-request order is preserved, so verify_ordering gives the same
+        verdict on the merge as on the shards.
+        """
+        return BehaviorV(events=tuple(e for s in self.shards for e in s.events))
+
+
+class PartitionedVLog:
+    """
+    Concurrent appender over a PartitionedV: one VLog per shard.
+
+    Appends for different shards never contend on the same lock.
+    """
+    __slots__ = ("_logs", "_id_key")
+
+    def __init__(self, shards: int, *, id_key: str = "correlation_id") -> None:
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        self._logs = tuple(VLog() for _ in range(shards))
+        self._id_key = id_key
+
+    def __len__(self) -> int:
+        return sum(len(log) for log in self._logs)
+
+    def append(self, event: DblEvent) -> tuple[int, int]:
+        """
+        Append event to its shard; returns (shard index, index within shard).
+        """
+        corr = _routing_id(event, self._id_key, self.__len__)
+        j = shard_of(corr, len(self._logs))
+        return j, self._logs[j].append(event)
+
+    def snapshot(self) -> PartitionedV:
+        return PartitionedV(shards=tuple(log.snapshot() for log in self._logs), id_key=self._id_key)
+
+
+def verify_partitioned(pv: PartitionedV, **ordering: Any) -> None:
+    """
+    Verify routing and per-shard ordering of a partitioned V.
+
+    Rules:
+    - Every event must carry pv.id_key and be stored in the shard it routes to.
+    - Each shard must pass verify_ordering with the given keyword arguments.
+    Violations name the shard; indices are positions within that shard.
+    """
+    n = len(pv.shards)
+    for j, shard in enumerate(pv.shards):
+        for idx, event in enumerate(shard.events):
+            corr = _require_id(event, id_key=pv.id_key, index=idx)
+            expected = shard_of(corr, n)
+            if expected != j:
+                raise PartitionViolation(
+                    f"event routes to shard {expected} but is stored in shard {j}; "
+                    f"{pv.id_key}={corr} index={idx}"
+                )
+        try:
+            verify_ordering(shard, id_key=pv.id_key, **ordering)
+        except OrderingViolation as exc:
+            raise OrderingViolation(f"shard={j}: {exc}") from exc
+
+
+def verify_partitioned_append_only(prev: PartitionedV, next_pv: PartitionedV) -> None:
+    """
+    Verify that next_pv extends prev shard by shard, with the same partitioning.
+    """
+    if len(prev.shards) != len(next_pv.shards) or prev.id_key != next_pv.id_key:
+        raise PartitionViolation("partitioning changed: shard count or id_key differs")
+    for j, (a, b) in enumerate(zip(prev.shards, next_pv.shards)):
+        try:
+            verify_append_only(a, b)
+        except AppendOnlyViolation as exc:
+            raise AppendOnlyViolation(f"shard={j}: {exc}") from exc
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Hashable
+from typing import Iterable, Tuple
+
+from .model import DblEvent, DblEventKind
+from .v import BehaviorV
+
+
+class _SortedColumn:
+    """
+    (value, position) pairs ordered by value, then by position.
+    """
+    __slots__ = ("values", "positions")
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self.positions: list[int] = []
+
+    def add(self, value: str, pos: int) -> None:
+        values = self.values
+        if not values or values[-1] <= value:
+            values.append(value)
+            self.positions.append(pos)
+            return
+        i = bisect_right(values, value)
+        values.insert(i, value)
+        self.positions.insert(i, pos)
+
+    def between(self, lo: str | None, hi: str | None) -> list[int]:
+        values = self.values
+        i = 0 if lo is None else bisect_left(values, lo)
+        j = len(values) if hi is None else bisect_left(values, hi)
+        return self.positions[i:j] if i < j else []
+
+
+class ObservationalIndex:
+    """
+    Secondary index over selected observational_fields of a V.
+
+    - eq_keys: equality lookups on hashable values
+    - range_keys: half-open [lo, hi) lookups on string values, such as
+      ISO-8601 timestamps
+
+    Queries return sorted stream positions t(e). Values of other types are
+    not indexed under that key. update() indexes only events appended since
+    the last call, so the caller must pass append-only extensions of the
+    indexed V. The index reads kind and observational_fields only; it never
+    touches deterministic fields, event digests or V digests.
+    Not thread-safe; use one writer.
+    """
+    __slots__ = ("eq_keys", "range_keys", "_count", "_kinds", "_eq", "_ranges")
+
+    def __init__(self, *, eq_keys: Iterable[str] = (), range_keys: Iterable[str] = ()) -> None:
+        self.eq_keys: Tuple[str, ...] = tuple(eq_keys)
+        self.range_keys: Tuple[str, ...] = tuple(range_keys)
+        self._count = 0
+        self._kinds: dict[DblEventKind, list[int]] = {}
+        self._eq: dict[tuple[str, DblEventKind | None], dict[tuple[type, Hashable], list[int]]] = {}
+        self._ranges: dict[tuple[str, DblEventKind | None], _SortedColumn] = {}
+
+    @classmethod
+    def build(
+        cls,
+        v: BehaviorV,
+        *,
+        eq_keys: Iterable[str] = (),
+        range_keys: Iterable[str] = (),
+    ) -> "ObservationalIndex":
+        index = cls(eq_keys=eq_keys, range_keys=range_keys)
+        index.update(v)
+        return index
+
+    def __len__(self) -> int:
+        return self._count
+
+    def update(self, v: BehaviorV) -> int:
+        """
+        Index the events of v past the already indexed prefix; returns how many.
+        """
+        events = v.events
+        if len(events) < self._count:
+            raise ValueError("V is shorter than the indexed prefix")
+        start = self._count
+        for pos in range(start, len(events)):
+            self._add(events[pos], pos)
+        self._count = len(events)
+        return self._count - start
+
+    def _add(self, event: DblEvent, pos: int) -> None:
+        kind = event.kind
+        self._kinds.setdefault(kind, []).append(pos)
+        obs = event.observational_fields
+        for key in self.eq_keys:
+            value = obs.get(key)
+            if value is None:
+                continue
+            slot = (type(value), value)
+            try:
+                hash(slot)
+            except TypeError:
+                continue
+            for scope in ((key, None), (key, kind)):
+                self._eq.setdefault(scope, {}).setdefault(slot, []).append(pos)
+        for key in self.range_keys:
+            value = obs.get(key)
+            if not isinstance(value, str):
+                continue
+            for scope in ((key, None), (key, kind)):
+                col = self._ranges.get(scope)
+                if col is None:
+                    col = self._ranges[scope] = _SortedColumn()
+                col.add(value, pos)
+
+    def of_kind(self, kind: DblEventKind) -> Tuple[int, ...]:
+        return tuple(self._kinds.get(kind, ()))
+
+    def equal(self, key: str, value: Hashable, *, kind: DblEventKind | None = None) -> Tuple[int, ...]:
+        """
+        Positions whose observational_fields[key] == value (same type).
+        """
+        if key not in self.eq_keys:
+            raise KeyError(f"{key!r} is not an equality-indexed key")
+        by_value = self._eq.get((key, kind))
+        if by_value is None:
+            return ()
+        return tuple(by_value.get((type(value), value), ()))
+
+    def range(
+        self,
+        key: str,
+        lo: str | None = None,
+        hi: str | None = None,
+        *,
+        kind: DblEventKind | None = None,
+    ) -> Tuple[int, ...]:
+        """
+        Positions whose observational_fields[key] is a string in [lo, hi).
+
+        None leaves that end open. Cost is O(log n + k log k) for k matches.
+        """
+        if key not in self.range_keys:
+            raise KeyError(f"{key!r} is not a range-indexed key")
+        col = self._ranges.get((key, kind))
+        if col is None:
+            return ()
+        return tuple(sorted(col.between(lo, hi)))
+
+
+def select(v: BehaviorV, positions: Iterable[int]) -> Tuple[DblEvent, ...]:
+    """
+    Events of v at the given positions, in the given order.
+    """
+    events = v.events
+    return tuple(events[i] for i in positions)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from json.encoder import encode_basestring
+from typing import Any, Callable, Iterable, Tuple
+
+from . import instrument as _instr
+from .canonical import DEFAULT_FORBIDDEN_KEYS, _norm_str, canonicalize_value
+from .digest import SCHEMA_VERSION, _COMPILED
+from .exceptions import CanonicalizationError
+from .model import DblEvent, DblEventKind
+
+
+_NONE = type(None)
+_SCALARS = (str, int, bool, _NONE)
+_MISSING = object()
+
+
+def _enc_str(v: Any) -> str:
+    return encode_basestring(_norm_str(v))
+
+
+def _enc_int(v: Any) -> str:
+    return int.__repr__(v)
+
+
+def _enc_bool(v: Any) -> str:
+    return "true" if v else "false"
+
+
+def _enc_none(v: Any) -> str:
+    return "null"
+
+
+def _enc_any(v: Any) -> str:
+    return json.dumps(
+        canonicalize_value(v),
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+    )
+
+
+_ENCODERS: dict[type, Callable[[Any], str]] = {
+    str: _enc_str,
+    int: _enc_int,
+    bool: _enc_bool,
+    _NONE: _enc_none,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class EventSchema:
+    """
+    Deterministic-field shape of one event kind: exact key set and value types.
+
+    Value types are drawn from str, int, bool, None and object; object accepts
+    any canonicalizable value (lists, nested mappings) via the generic path.
+    Types match exactly, so a bool never satisfies int.
+    """
+    kind: DblEventKind
+    fields: Mapping[str, Tuple[type, ...]]
+
+    def __post_init__(self) -> None:
+        norm: dict[str, Tuple[type, ...]] = {}
+        for key, types in self.fields.items():
+            if not isinstance(key, str):
+                raise ValueError("schema keys must be strings")
+            if not isinstance(types, tuple):
+                types = (types,)
+            types = tuple(_NONE if t is None else t for t in types)
+            for t in types:
+                if t is not object and t not in _SCALARS:
+                    raise ValueError(f"unsupported schema type for {key!r}: {t!r}")
+            if not types:
+                raise ValueError(f"schema field {key!r} has no types")
+            norm[key] = types
+        object.__setattr__(self, "fields", norm)
+
+
+class CompiledCanonicalizer:
+    """
+    Canonical digest-payload encoder specialized to one EventSchema.
+
+    Keys are NFC-normalized, sorted and JSON-encoded once at compile time.
+    Output is byte-identical to the generic event_canonical_bytes; __call__
+    returns None when an event does not match the schema, so the caller
+    falls back to the generic path (which also produces its errors).
+    """
+    __slots__ = ("schema", "_plan", "_prefix", "_suffix", "_forbidden")
+
+    def __init__(self, schema: EventSchema) -> None:
+        by_nfc: dict[str, str] = {}
+        for key in schema.fields:
+            nk = _norm_str(key)
+            if nk in by_nfc:
+                raise ValueError(f"schema keys {by_nfc[nk]!r} and {key!r} collide under NFC")
+            by_nfc[nk] = key
+
+        plan = []
+        for i, nk in enumerate(sorted(by_nfc)):
+            key = by_nfc[nk]
+            types = schema.fields[key]
+            if object in types:
+                encoders = None
+            else:
+                encoders = {t: _ENCODERS[t] for t in types}
+            frag = ("," if i else "") + encode_basestring(nk) + ":"
+            plan.append((key, frag, encoders))
+
+        deny = {k.casefold() for k in DEFAULT_FORBIDDEN_KEYS}
+        self.schema = schema
+        self._plan = tuple(plan)
+        self._prefix = '{"deterministic_fields":{'
+        self._suffix = (
+            '},"kind":' + encode_basestring(schema.kind.value)
+            + ',"schema_version":' + str(SCHEMA_VERSION) + "}"
+        )
+        self._forbidden = any(k.casefold() in deny for k in schema.fields)
+
+    def __call__(self, event: DblEvent, enforce_keys: bool = True) -> bytes | None:
+        if event.kind is not self.schema.kind:
+            return None
+        if enforce_keys and self._forbidden:
+            return None
+        fields = event.deterministic_fields
+        if len(fields) != len(self._plan):
+            return None
+        parts = [self._prefix]
+        try:
+            for key, frag, encoders in self._plan:
+                v = fields.get(key, _MISSING)
+                if v is _MISSING:
+                    return None
+                if encoders is None:
+                    parts.append(frag + _enc_any(v))
+                    continue
+                enc = encoders.get(type(v))
+                if enc is None:
+                    return None
+                parts.append(frag + enc(v))
+        except (CanonicalizationError, ValueError):
+            # e.g. ints beyond sys.int_max_str_digits; the generic path reports it.
+            return None
+        parts.append(self._suffix)
+        if _instr.ACTIVE:
+            _instr.count("events_canonicalized")
+        return "".join(parts).encode("utf-8")
+
+
+def infer_schema(events: Iterable[DblEvent]) -> EventSchema:
+    """
+    Infer the EventSchema shared by events.
+
+    All events must have the same kind and the same deterministic key set.
+    Keys whose values are only str/int/bool/None get those types; anything
+    else (lists, mappings) is typed object.
+    """
+    kind: DblEventKind | None = None
+    seen: dict[str, set[type]] = {}
+    for idx, event in enumerate(events):
+        keys = set(event.deterministic_fields.keys())
+        if kind is None:
+            kind = event.kind
+            seen = {k: set() for k in keys}
+        elif event.kind is not kind:
+            raise ValueError(f"mixed event kinds: {kind.value} and {event.kind.value}; index={idx}")
+        elif keys != seen.keys():
+            raise ValueError(f"deterministic key set differs from first event; index={idx}")
+        for k, v in event.deterministic_fields.items():
+            seen[k].add(type(v))
+    if kind is None:
+        raise ValueError("cannot infer a schema from no events")
+
+    fields: dict[str, Tuple[type, ...]] = {}
+    for k, types in seen.items():
+        if types <= set(_SCALARS):
+            fields[k] = tuple(t for t in _SCALARS if t in types)
+        else:
+            fields[k] = (object,)
+    return EventSchema(kind=kind, fields=fields)
+
+
+def register_schema(schema: EventSchema) -> CompiledCanonicalizer:
+    """
+    Compile schema and use it for event_canonical_bytes / event_digest of its kind.
+
+    Replaces any schema registered for the same kind. Registration is
+    per process; worker processes must register their own.
+    """
+    compiled = CompiledCanonicalizer(schema)
+    _COMPILED[schema.kind] = compiled
+    return compiled
+
+
+def unregister_schema(kind: DblEventKind) -> None:
+    _COMPILED.pop(kind, None)
+
+
+def registered_schema(kind: DblEventKind) -> EventSchema | None:
+    compiled = _COMPILED.get(kind)
+    return compiled.schema if isinstance(compiled, CompiledCanonicalizer) else None
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Iterator, Tuple
+
+from .digest import v_digest_buffer
+from .model import DblEvent
+from .v import BehaviorV
+
+
+# Segment layout:
+#   header  : magic(4) | layout version u32 | event count u64 | payload length u64 | tracker id u64
+#   digests : count * 32 bytes, event digests in stream order
+#   offsets : (count + 1) * u64 native-endian, payload offsets per event
+#   payload : pickled DblEvent records, concatenated
+_MAGIC = b"DBLV"
+_LAYOUT_VERSION = 1
+_HEADER = struct.Struct("<4sIQQQ")
+_NOT_A_V = "shared memory segment is not a dbl-vlog V (layout version 1)"
+
+
+class SharedVSegment:
+    """
+    Owner handle of a V published into shared memory.
+
+    The publishing process must keep this handle alive while workers are
+    attached and call unlink() once the segment is no longer needed.
+    """
+    __slots__ = ("_shm",)
+
+    def __init__(self, shm: shared_memory.SharedMemory) -> None:
+        self._shm = shm
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def size(self) -> int:
+        return self._shm.size
+
+    def close(self) -> None:
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedVSegment":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+        self.unlink()
+
+
+def publish_shared(v: BehaviorV, *, name: str | None = None) -> SharedVSegment:
+    """
+    Copy V, its event digests and an offset index into a new shared memory segment.
+
+    Events are stored pickled; only attach segments from a trusted publisher.
+    """
+    digests = v.event_digests()
+    records = [pickle.dumps(e, protocol=pickle.HIGHEST_PROTOCOL) for e in v.events]
+    count = len(records)
+    payload_len = sum(len(r) for r in records)
+
+    digests_at = _HEADER.size
+    offsets_at = digests_at + 32 * count
+    payload_at = offsets_at + 8 * (count + 1)
+    size = payload_at + payload_len
+
+    shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+    try:
+        buf = shm.buf
+        _HEADER.pack_into(buf, 0, _MAGIC, _LAYOUT_VERSION, count, payload_len, _tracker_id())
+        buf[digests_at:offsets_at] = b"".join(digests)
+        offsets = buf[offsets_at:payload_at].cast("Q")
+        pos = 0
+        for idx, rec in enumerate(records):
+            offsets[idx] = pos
+            buf[payload_at + pos : payload_at + pos + len(rec)] = rec
+            pos += len(rec)
+        offsets[count] = pos
+        offsets.release()
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    return SharedVSegment(shm)
+
+
+def attach_shared(name: str) -> "SharedV":
+    return SharedV(_attach(name))
+
+
+def _tracker_id() -> int:
+    """
+    Identity of this process's resource tracker, 0 if there is none.
+
+    The tracker is reached through a pipe that multiprocessing children
+    inherit (fork) or are handed (spawn); the pipe's inode is the same in
+    every process sharing one tracker.
+    """
+    if os.name != "posix":
+        return 0
+    fd = resource_tracker._resource_tracker._fd  # type: ignore[attr-defined]
+    if fd is None:
+        return 0
+    try:
+        return os.fstat(fd).st_ino
+    except OSError:
+        return 0
+
+
+def _peek_header(name: str) -> tuple[Any, ...] | None:
+    """
+    Header of segment name, read through a private read-only mapping.
+
+    None if the segment is too small to hold one. Does not register the
+    segment with the resource tracker.
+    """
+    import _posixshmem  # type: ignore[import-not-found]
+
+    fd = _posixshmem.shm_open("/" + name.lstrip("/"), os.O_RDONLY, mode=0o600)
+    try:
+        if os.fstat(fd).st_size < _HEADER.size:
+            return None
+        with mmap.mmap(fd, _HEADER.size, prot=mmap.PROT_READ) as m:
+            return _HEADER.unpack_from(m, 0)
+    finally:
+        os.close(fd)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    if os.name != "posix":
+        return shared_memory.SharedMemory(name=name)
+    # Validate before SharedMemory registers the segment with this process's
+    # resource tracker: a foreign segment must never be registered, or the
+    # tracker would unlink it when this process exits.
+    header = _peek_header(name)
+    if header is None or header[0] != _MAGIC or header[1] != _LAYOUT_VERSION:
+        raise ValueError(_NOT_A_V)
+    shm = shared_memory.SharedMemory(name=name)
+    # A tracker shared with the publisher already holds the publisher's
+    # registration, which it needs for unlink() and crash cleanup. A tracker
+    # of an unrelated process must drop it, or it would unlink the
+    # publisher's segment when this process exits.
+    publisher = header[4]
+    if publisher == 0 or publisher != _tracker_id():
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+class SharedV:
+    """
+    Read-only, BehaviorV-compatible view of a V in shared memory.
+
+    Event digests and the V digest are read from the segment without decoding
+    events. Events are decoded lazily on access. Call close() when done.
+    """
+    __slots__ = ("_shm", "_count", "_digests", "_offsets", "_payload")
+
+    def __init__(self, shm: shared_memory.SharedMemory) -> None:
+        buf = shm.buf.toreadonly()
+        if len(buf) < _HEADER.size or _HEADER.unpack_from(buf, 0)[:2] != (_MAGIC, _LAYOUT_VERSION):
+            buf.release()
+            shm.close()
+            raise ValueError(_NOT_A_V)
+        _, _, count, payload_len, _ = _HEADER.unpack_from(buf, 0)
+        digests_at = _HEADER.size
+        offsets_at = digests_at + 32 * count
+        payload_at = offsets_at + 8 * (count + 1)
+        self._shm = shm
+        self._count = count
+        self._digests = buf[digests_at:offsets_at]
+        self._offsets = buf[offsets_at:payload_at].cast("Q")
+        self._payload = buf[payload_at : payload_at + payload_len]
+        buf.release()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[DblEvent]:
+        for idx in range(self._count):
+            yield self.at(idx)
+
+    def __getitem__(self, index: int) -> DblEvent:
+        return self.at(index)
+
+    def __repr__(self) -> str:
+        return f"SharedV(name={self._shm.name!r}, len={self._count})"
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def events(self) -> Tuple[DblEvent, ...]:
+        return tuple(self)
+
+    def at(self, index: int) -> DblEvent:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("event index out of range")
+        start = self._offsets[index]
+        end = self._offsets[index + 1]
+        return pickle.loads(self._payload[start:end])
+
+    def event_digest_at(self, index: int) -> bytes:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("event index out of range")
+        return self._digests[index * 32 : index * 32 + 32].tobytes()
+
+    def event_digests(self) -> list[bytes]:
+        d = self._digests
+        return [d[off : off + 32].tobytes() for off in range(0, len(d), 32)]
+
+    def digest(self) -> bytes:
+        return v_digest_buffer(self._digests)
+
+    def digest_hex(self) -> str:
+        return self.digest().hex()
+
+    def to_v(self) -> BehaviorV:
+        """
+        Decode all events into a BehaviorV, reusing the shared event digests.
+        """
+        return BehaviorV()._extend_digested(self.events, self.event_digests())  # type: ignore[arg-type]
+
+    def close(self) -> None:
+        for mv in (self._digests, self._offsets, self._payload):
+            mv.release()
+        self._shm.close()
+
+    def __enter__(self) -> "SharedV":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from collections.abc import Mapping
+from typing import Any, Iterable, Iterator, Tuple
+
+from . import instrument as _instr
+from .canonical import canonical_json_bytes
+from .digest import event_digest_payload, v_digest
+from .model import DblEvent
+from .v import BehaviorV
+
+
+@dataclass(frozen=True, slots=True)
+class StoreStats:
+    """
+    Deduplication counters of an EventStore.
+
+    Sizes are measured in canonical JSON bytes of the digest payload, which is
+    the deterministic content a stored entry stands for.
+    """
+    puts: int = 0
+    unique: int = 0
+    canonical_bytes_total: int = 0
+    canonical_bytes_unique: int = 0
+
+    @property
+    def dedup_ratio(self) -> float:
+        if self.unique == 0:
+            return 1.0
+        return self.puts / self.unique
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.canonical_bytes_total - self.canonical_bytes_unique
+
+
+class EventStore:
+    """
+    Content-addressed store of deterministic event content, keyed by event_digest.
+
+    Events with identical deterministic payloads share one stored entry.
+    Observational fields are not stored; they stay with the referencing position.
+    Each entry holds the canonical form of the deterministic fields (NFC
+    strings, sequences as lists), the one content all events under a digest
+    share, so get() does not depend on which variant was stored first.
+    """
+    __slots__ = ("_entries", "_puts", "_bytes_total", "_bytes_unique")
+
+    def __init__(self) -> None:
+        self._entries: dict[bytes, DblEvent] = {}
+        self._puts = 0
+        self._bytes_total = 0
+        self._bytes_unique = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, ref: object) -> bool:
+        return ref in self._entries
+
+    def put(self, event: DblEvent) -> bytes:
+        """
+        Store the deterministic content of event and return its event digest.
+        """
+        payload = event_digest_payload(event)
+        b = canonical_json_bytes(payload)
+        if _instr.ACTIVE:
+            _instr.count("bytes_hashed", len(b))
+        ref = hashlib.sha256(b).digest()
+        self._puts += 1
+        self._bytes_total += len(b)
+        if ref not in self._entries:
+            self._entries[ref] = DblEvent(
+                kind=event.kind,
+                deterministic_fields=payload["deterministic_fields"],
+                observational_fields={},
+            )
+            self._bytes_unique += len(b)
+        return ref
+
+    def get(self, ref: bytes) -> DblEvent:
+        """
+        Return the canonical event for ref, without observational fields.
+        """
+        try:
+            return self._entries[ref]
+        except KeyError:
+            raise KeyError(f"unknown event digest: {ref.hex()}") from None
+
+    def stats(self) -> StoreStats:
+        return StoreStats(
+            puts=self._puts,
+            unique=len(self._entries),
+            canonical_bytes_total=self._bytes_total,
+            canonical_bytes_unique=self._bytes_unique,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class StoredV:
+    """
+    Event stream V held as event digest references into an EventStore.
+
+    Each position keeps its own observational fields. Event and stream digests
+    are identical to those of the equivalent BehaviorV; the stream digest is
+    computed from the references without re-canonicalizing events.
+    """
+    store: EventStore = field(compare=False, repr=False)
+    refs: Tuple[bytes, ...] = ()
+    observational: Tuple[Mapping[str, Any], ...] = ()
+
+    def __post_init__(self) -> None:
+        if len(self.refs) != len(self.observational):
+            raise ValueError("refs and observational must have the same length")
+
+    @classmethod
+    def from_events(cls, store: EventStore, events: Iterable[DblEvent]) -> "StoredV":
+        refs: list[bytes] = []
+        obs: list[Mapping[str, Any]] = []
+        for event in events:
+            refs.append(store.put(event))
+            obs.append(event.observational_fields)
+        return cls(store=store, refs=tuple(refs), observational=tuple(obs))
+
+    @classmethod
+    def from_v(cls, store: EventStore, v: BehaviorV) -> "StoredV":
+        return cls.from_events(store, v.events)
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def __iter__(self) -> Iterator[DblEvent]:
+        for idx in range(len(self.refs)):
+            yield self.at(idx)
+
+    def at(self, index: int) -> DblEvent:
+        """
+        Event at index with canonical deterministic fields and its own observational fields.
+        """
+        rep = self.store.get(self.refs[index])
+        return DblEvent(
+            kind=rep.kind,
+            deterministic_fields=rep.deterministic_fields,
+            observational_fields=self.observational[index],
+        )
+
+    def append(self, event: DblEvent) -> "StoredV":
+        ref = self.store.put(event)
+        return StoredV(
+            store=self.store,
+            refs=self.refs + (ref,),
+            observational=self.observational + (event.observational_fields,),
+        )
+
+    def event_digests(self) -> list[bytes]:
+        return list(self.refs)
+
+    def digest(self) -> bytes:
+        return v_digest(self.event_digests())
+
+    def digest_hex(self) -> str:
+        return self.digest().hex()
+
+    def to_v(self) -> BehaviorV:
+        """
+        Materialize V with canonical deterministic fields.
+
+        Equal to the source V when its deterministic fields were already
+        canonical; the digest is the same either way.
+        """
+        return BehaviorV(events=tuple(self))
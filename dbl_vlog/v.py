@@ -1,20 +1,112 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterator, Tuple
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Iterable, Iterator, Tuple
 
-from .digest import event_digest, v_digest
+from . import instrument as _instr
+from .digest import event_digest
 from .model import DblEvent
 
 
+CHECKPOINT_INTERVAL = 256
+
+
+class _DigestIndex:
+    """
+    Lazily filled event digests and running V digest checkpoints.
+
+    Entry i depends only on events[0..i], so one index can be shared by a V
+    and all of its prefixes. checkpoints[k] is the running hash state after
+    k * CHECKPOINT_INTERVAL (index, event_digest) pairs.
+    """
+    __slots__ = ("digests", "checkpoints", "running", "lock")
+
+    def __init__(
+        self,
+        digests: list[bytes] | None = None,
+        checkpoints: list[Any] | None = None,
+        running: Any = None,
+    ) -> None:
+        self.digests: list[bytes] = digests if digests is not None else []
+        self.checkpoints: list[Any] = checkpoints if checkpoints is not None else [hashlib.sha256()]
+        self.running: Any = running if running is not None else self.checkpoints[-1].copy()
+        self.lock = threading.Lock()
+
+    def fill(self, events: Tuple[DblEvent, ...], n: int) -> None:
+        if _instr.ACTIVE:
+            cached = min(len(self.digests), n)
+            _instr.count("digest_cache_hits", cached)
+            _instr.count("digest_cache_misses", n - cached)
+        if len(self.digests) >= n:
+            return
+        with self.lock:
+            self._push(event_digest(events[idx]) for idx in range(len(self.digests), n))
+
+    def extend(self, digests: Iterable[bytes]) -> None:
+        with self.lock:
+            self._push(digests)
+
+    def _push(self, digests: Iterable[bytes]) -> None:
+        out = self.digests
+        h = self.running
+        start = len(out)
+        try:
+            for d in digests:
+                idx = len(out)
+                h.update(idx.to_bytes(8, byteorder="big", signed=False))
+                h.update(d)
+                out.append(d)
+                if (idx + 1) % CHECKPOINT_INTERVAL == 0:
+                    self.checkpoints.append(h.copy())
+        finally:
+            if _instr.ACTIVE:
+                _instr.count("bytes_hashed", 40 * (len(out) - start))
+
+    def prefix_digest(self, events: Tuple[DblEvent, ...], n: int) -> bytes:
+        self.fill(events, n)
+        return self._state(n).digest()
+
+    def copy(self, n: int) -> "_DigestIndex":
+        """
+        Independent index holding the entries of the first n events.
+        """
+        with self.lock:
+            n = min(n, len(self.digests))
+            digests = self.digests[:n]
+            checkpoints = self.checkpoints[: n // CHECKPOINT_INTERVAL + 1]
+            running = self._state(n)
+        return _DigestIndex(digests, checkpoints, running)
+
+    def _state(self, n: int) -> Any:
+        k = n // CHECKPOINT_INTERVAL
+        h = self.checkpoints[k].copy()
+        digests = self.digests
+        for idx in range(k * CHECKPOINT_INTERVAL, n):
+            h.update(idx.to_bytes(8, byteorder="big", signed=False))
+            h.update(digests[idx])
+        return h
+
+
 @dataclass(frozen=True, slots=True)
 class BehaviorV:
     """
     Immutable append-only event stream V.
 
     Total order is tuple order. Index t(e) is the position in this tuple.
+    Event digests and running digest checkpoints are cached on first use;
+    nested values must not be mutated after events are appended.
     """
     events: Tuple[DblEvent, ...] = ()
+    _index: _DigestIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_index", _DigestIndex())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (BehaviorV, (self.events,))
 
     def __len__(self) -> int:
         return len(self.events)
@@ -22,6 +114,18 @@ class BehaviorV:
     def __iter__(self) -> Iterator[DblEvent]:
         return iter(self.events)
 
+    def __getitem__(self, key: int | slice) -> Any:
+        """
+        Index access returns an event. Slices starting at 0 with step 1 return
+        a VPrefix view; other slices return a new BehaviorV.
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self.events))
+            if start == 0 and step == 1:
+                return self.prefix(stop)
+            return BehaviorV(events=self.events[key])
+        return self.events[key]
+
     def __repr__(self) -> str:
         if not self.events:
             return "BehaviorV(len=0)"
@@ -32,17 +136,122 @@ class BehaviorV:
         return self.events[index]
 
     def append(self, event: DblEvent) -> "BehaviorV":
-        return BehaviorV(events=self.events + (event,))
+        return self._derive(self.events + (event,), self._index.copy(len(self.events)))
+
+    def extend(self, events: Iterable[DblEvent]) -> "BehaviorV":
+        """
+        Append several events with a single copy of the event tuple.
+        """
+        return self._derive(self.events + tuple(events), self._index.copy(len(self.events)))
+
+    def prefix(self, n: int) -> "VPrefix":
+        """
+        View of the first n events, sharing storage and digest cache with this V.
+        """
+        if n < 0 or n > len(self.events):
+            raise IndexError("prefix length out of range")
+        return VPrefix(parent=self, stop=n)
 
     def event_digests(self) -> list[bytes]:
-        return [event_digest(e) for e in self.events]
+        n = len(self.events)
+        self._index.fill(self.events, n)
+        return self._index.digests[:n]
 
     def digest(self) -> bytes:
-        return v_digest(self.event_digests())
+        return self._index.prefix_digest(self.events, len(self.events))
 
     def digest_hex(self) -> str:
         return self.digest().hex()
 
+    def _extend_digested(
+        self,
+        events: Tuple[DblEvent, ...],
+        digests: list[bytes | None],
+    ) -> "BehaviorV":
+        """
+        extend() with event digests already computed by the caller.
+
+        Digests are adopted only when this V's cache is complete and every
+        digest is known; otherwise they are recomputed lazily.
+        """
+        n = len(self.events)
+        index = self._index.copy(n)
+        if len(index.digests) == n and None not in digests:
+            index.extend(digests)  # type: ignore[arg-type]
+        return self._derive(self.events + events, index)
+
+    @staticmethod
+    def _derive(events: Tuple[DblEvent, ...], index: _DigestIndex) -> "BehaviorV":
+        v = BehaviorV(events=events)
+        object.__setattr__(v, "_index", index)
+        return v
+
+
+@dataclass(frozen=True, slots=True)
+class VPrefix:
+    """
+    Read-only view of the first `stop` events of a BehaviorV.
+
+    The view shares the parent's events and digest cache. digest() is served
+    from the nearest running digest checkpoint, hashing at most
+    CHECKPOINT_INTERVAL pairs once the parent's event digests are cached.
+    """
+    parent: BehaviorV
+    stop: int
+
+    def __len__(self) -> int:
+        return self.stop
+
+    def __iter__(self) -> Iterator[DblEvent]:
+        return islice(self.parent.events, self.stop)
+
+    def __repr__(self) -> str:
+        return f"VPrefix(len={self.stop}, parent_len={len(self.parent)})"
+
+    def __getitem__(self, key: int | slice) -> Any:
+        """
+        Same rules as BehaviorV.__getitem__, relative to the first stop events.
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.stop)
+            if start == 0 and step == 1:
+                return self.prefix(stop)
+            return BehaviorV(events=self.events[key])
+        return self.at(key)
+
+    @property
+    def events(self) -> Tuple[DblEvent, ...]:
+        return self.parent.events[: self.stop]
+
+    def at(self, index: int) -> DblEvent:
+        if index < 0:
+            index += self.stop
+        if not 0 <= index < self.stop:
+            raise IndexError("event index out of range")
+        return self.parent.events[index]
+
+    def prefix(self, n: int) -> "VPrefix":
+        if n < 0 or n > self.stop:
+            raise IndexError("prefix length out of range")
+        return VPrefix(parent=self.parent, stop=n)
+
+    def event_digests(self) -> list[bytes]:
+        index = self.parent._index
+        index.fill(self.parent.events, self.stop)
+        return index.digests[: self.stop]
+
+    def digest(self) -> bytes:
+        return self.parent._index.prefix_digest(self.parent.events, self.stop)
+
+    def digest_hex(self) -> str:
+        return self.digest().hex()
+
+    def to_v(self) -> BehaviorV:
+        """
+        Materialize as a BehaviorV that still shares the parent's digest cache.
+        """
+        return BehaviorV._derive(self.events, self.parent._index)
+
 
 def append_event(v: BehaviorV, event: DblEvent) -> BehaviorV:
     return v.append(event)
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import re
+from typing import Any, Callable, Iterable
+
+from . import instrument as _instr
 from .canonical import canonicalize_value
 from .exceptions import AppendOnlyViolation, CanonicalizationError, IdentityViolation, OrderingViolation
 from .model import DblEvent, DblEventKind
 from .v import BehaviorV
 
 
+_SHA256_LABEL = re.compile(r"sha256:[0-9a-fA-F]{64}")
+_SHA256_LABEL_LINES = re.compile(r"^sha256:[0-9a-fA-F]{64}$", re.MULTILINE)
+_SHA256_LABEL_LEN = len("sha256:") + 64
+_LABEL_KEYS = ("boundary_config_hash", "intent_digest", "input_digest", "policy_digest")
+
+
+@_instr.timed("verify_append_only")
 def verify_append_only(prev_v: BehaviorV, next_v: BehaviorV) -> None:
     """
     Verify that next_v extends prev_v by appending events only.
@@ -21,6 +32,7 @@ def verify_append_only(prev_v: BehaviorV, next_v: BehaviorV) -> None:
         raise AppendOnlyViolation("prefix mismatch: stream is not append-only")
 
 
+@_instr.timed("verify_ordering")
 def verify_ordering(
     v: BehaviorV,
     *,
@@ -36,42 +48,80 @@ def verify_ordering(
     - If EXECUTION or PROOF appears, a prior DECISION must exist for the same id.
     - If require_intent_before_decision is set, DECISION must follow INTENT.
     """
-    seen_intent: set[str] = set()
-    seen_decision: dict[str, int] = {}
-    seen_execution: set[str] = set()
-
+    state = _OrderingState(
+        id_key=id_key,
+        require_intent_before_decision=require_intent_before_decision,
+        disallow_decision_after_execution=disallow_decision_after_execution,
+        max_decisions_per_id=max_decisions_per_id,
+    )
     for idx, event in enumerate(v.events):
-        corr = _require_id(event, id_key=id_key, index=idx)
+        state.check(event.kind, event.deterministic_fields.get(id_key), idx)
+
+
+class _OrderingState:
+    """
+    Incremental verify_ordering: feed events in stream order via check().
+    """
+    __slots__ = (
+        "id_key",
+        "require_intent_before_decision",
+        "disallow_decision_after_execution",
+        "max_decisions_per_id",
+        "seen_intent",
+        "seen_decision",
+        "seen_execution",
+    )
+
+    def __init__(
+        self,
+        *,
+        id_key: str = "correlation_id",
+        require_intent_before_decision: bool = False,
+        disallow_decision_after_execution: bool = True,
+        max_decisions_per_id: int = 1,
+    ) -> None:
+        self.id_key = id_key
+        self.require_intent_before_decision = require_intent_before_decision
+        self.disallow_decision_after_execution = disallow_decision_after_execution
+        self.max_decisions_per_id = max_decisions_per_id
+        self.seen_intent: set[str] = set()
+        self.seen_decision: dict[str, int] = {}
+        self.seen_execution: set[str] = set()
 
-        if event.kind == DblEventKind.INTENT:
-            seen_intent.add(corr)
-            continue
+    def check(self, kind: DblEventKind, id_value: object, idx: int) -> None:
+        id_key = self.id_key
+        corr = _require_id_value(kind, id_value, id_key=id_key, index=idx)
 
-        if event.kind == DblEventKind.DECISION:
-            if require_intent_before_decision and corr not in seen_intent:
+        if kind == DblEventKind.INTENT:
+            self.seen_intent.add(corr)
+            return
+
+        if kind == DblEventKind.DECISION:
+            if self.require_intent_before_decision and corr not in self.seen_intent:
                 raise OrderingViolation(
                     f"DECISION observed before INTENT for {id_key}={corr}; index={idx}"
                 )
-            if disallow_decision_after_execution and corr in seen_execution:
+            if self.disallow_decision_after_execution and corr in self.seen_execution:
                 raise OrderingViolation(
                     f"DECISION observed after EXECUTION/PROOF for {id_key}={corr}; index={idx}"
                 )
-            count = seen_decision.get(corr, 0) + 1
-            if max_decisions_per_id > 0 and count > max_decisions_per_id:
+            count = self.seen_decision.get(corr, 0) + 1
+            if self.max_decisions_per_id > 0 and count > self.max_decisions_per_id:
                 raise OrderingViolation(
-                    f"DECISION count exceeds {max_decisions_per_id} for {id_key}={corr}; index={idx}"
+                    f"DECISION count exceeds {self.max_decisions_per_id} for {id_key}={corr}; index={idx}"
                 )
-            seen_decision[corr] = count
-            continue
+            self.seen_decision[corr] = count
+            return
 
-        if event.kind in (DblEventKind.EXECUTION, DblEventKind.PROOF):
-            if corr not in seen_decision:
+        if kind in (DblEventKind.EXECUTION, DblEventKind.PROOF):
+            if corr not in self.seen_decision:
                 raise OrderingViolation(
-                    f"{event.kind.value} observed before DECISION for {id_key}={corr}; index={idx}"
+                    f"{kind.value} observed before DECISION for {id_key}={corr}; index={idx}"
                 )
-            seen_execution.add(corr)
+            self.seen_execution.add(corr)
 
 
+@_instr.timed("verify_identity_fields")
 def verify_identity_fields(
     v: BehaviorV,
     *,
@@ -84,82 +134,110 @@ def verify_identity_fields(
     - INTENT requires boundary_version and boundary_config_hash.
     - DECISION requires policy_version or policy_digest.
     """
+    valid_labels = _valid_sha256_labels(
+        event.deterministic_fields.get(k) for event in v.events for k in _LABEL_KEYS
+    )
+
+    def is_valid(value: object) -> bool:
+        return isinstance(value, str) and value in valid_labels
+
     for idx, event in enumerate(v.events):
-        corr = event.deterministic_fields.get(id_key)
-        if isinstance(corr, str):
-            corr_label = canonicalize_value(corr)
-        else:
-            corr_label = "unknown"
-        if event.kind == DblEventKind.INTENT:
-            missing = [
-                k for k in ("boundary_version", "boundary_config_hash")
-                if k not in event.deterministic_fields
-            ]
-            if missing:
-                raise IdentityViolation(
-                    f"INTENT missing deterministic identity fields: {missing}; "
-                    f"{id_key}={corr_label} index={idx}"
-                )
-            boundary_hash = event.deterministic_fields.get("boundary_config_hash")
-            if not _is_sha256_label(boundary_hash):
-                raise IdentityViolation(
-                    f"INTENT has invalid boundary_config_hash; {id_key}={corr_label} index={idx}"
-                )
-            intent_digest = event.deterministic_fields.get("intent_digest")
-            input_digest = event.deterministic_fields.get("input_digest")
-            if intent_digest is not None and not _is_sha256_label(intent_digest):
-                raise IdentityViolation(
-                    f"INTENT has invalid intent_digest; {id_key}={corr_label} index={idx}"
-                )
-            if input_digest is not None and not _is_sha256_label(input_digest):
-                raise IdentityViolation(
-                    f"INTENT has invalid input_digest; {id_key}={corr_label} index={idx}"
-                )
-            if intent_digest is None and input_digest is None:
-                raise IdentityViolation(
-                    "INTENT missing input_digest or intent_digest; "
-                    f"{id_key}={corr_label} index={idx}"
-                )
-        elif event.kind == DblEventKind.DECISION:
-            policy_digest = event.deterministic_fields.get("policy_digest")
-            if policy_digest is not None and not _is_sha256_label(policy_digest):
-                raise IdentityViolation(
-                    "DECISION has invalid policy_digest; "
-                    f"{id_key}={corr_label} index={idx}"
-                )
-            if (
-                "policy_version" not in event.deterministic_fields
-                and policy_digest is None
-            ):
-                raise IdentityViolation(
-                    "DECISION missing policy_version or policy_digest; "
-                    f"{id_key}={corr_label} index={idx}"
-                )
+        _check_identity(event, idx, id_key=id_key, is_valid=is_valid)
+
+
+def _check_identity(
+    event: DblEvent,
+    idx: int,
+    *,
+    id_key: str,
+    is_valid: Callable[[object], bool],
+) -> None:
+    corr = event.deterministic_fields.get(id_key)
+    if isinstance(corr, str):
+        corr_label = canonicalize_value(corr)
+    else:
+        corr_label = "unknown"
+    if event.kind == DblEventKind.INTENT:
+        missing = [
+            k for k in ("boundary_version", "boundary_config_hash")
+            if k not in event.deterministic_fields
+        ]
+        if missing:
+            raise IdentityViolation(
+                f"INTENT missing deterministic identity fields: {missing}; "
+                f"{id_key}={corr_label} index={idx}"
+            )
+        boundary_hash = event.deterministic_fields.get("boundary_config_hash")
+        if not is_valid(boundary_hash):
+            raise IdentityViolation(
+                f"INTENT has invalid boundary_config_hash; {id_key}={corr_label} index={idx}"
+            )
+        intent_digest = event.deterministic_fields.get("intent_digest")
+        input_digest = event.deterministic_fields.get("input_digest")
+        if intent_digest is not None and not is_valid(intent_digest):
+            raise IdentityViolation(
+                f"INTENT has invalid intent_digest; {id_key}={corr_label} index={idx}"
+            )
+        if input_digest is not None and not is_valid(input_digest):
+            raise IdentityViolation(
+                f"INTENT has invalid input_digest; {id_key}={corr_label} index={idx}"
+            )
+        if intent_digest is None and input_digest is None:
+            raise IdentityViolation(
+                "INTENT missing input_digest or intent_digest; "
+                f"{id_key}={corr_label} index={idx}"
+            )
+    elif event.kind == DblEventKind.DECISION:
+        policy_digest = event.deterministic_fields.get("policy_digest")
+        if policy_digest is not None and not is_valid(policy_digest):
+            raise IdentityViolation(
+                "DECISION has invalid policy_digest; "
+                f"{id_key}={corr_label} index={idx}"
+            )
+        if (
+            "policy_version" not in event.deterministic_fields
+            and policy_digest is None
+        ):
+            raise IdentityViolation(
+                "DECISION missing policy_version or policy_digest; "
+                f"{id_key}={corr_label} index={idx}"
+            )
 
 
 def _require_id(event: DblEvent, *, id_key: str, index: int) -> str:
-    value = event.deterministic_fields.get(id_key)
+    return _require_id_value(event.kind, event.deterministic_fields.get(id_key), id_key=id_key, index=index)
+
+
+def _require_id_value(kind: DblEventKind, value: object, *, id_key: str, index: int) -> str:
     if not isinstance(value, str) or value == "":
         raise OrderingViolation(
-            f"missing {id_key} in deterministic_fields; kind={event.kind.value} index={index}"
+            f"missing {id_key} in deterministic_fields; kind={kind.value} index={index}"
         )
     return str(canonicalize_value(value))
 
 
 def _is_sha256_label(value: object) -> bool:
-    if not isinstance(value, str):
-        return False
-    if not value.startswith("sha256:"):
-        return False
-    hex_part = value[len("sha256:") :]
-    if len(hex_part) != 64:
-        return False
-    for ch in hex_part:
-        if ch.lower() not in "0123456789abcdef":
-            return False
-    return True
+    return isinstance(value, str) and _SHA256_LABEL.fullmatch(value) is not None
 
 
+def _valid_sha256_labels(values: Iterable[object]) -> frozenset[str]:
+    """
+    Validate many digest labels at once and return the set of valid ones.
+
+    Distinct candidates of the right length are joined into one buffer and
+    scanned with a single regex pass; non-strings are ignored.
+    """
+    candidates = {
+        value for value in values
+        if isinstance(value, str) and len(value) == _SHA256_LABEL_LEN
+    }
+    if not candidates:
+        return frozenset()
+    joined = "\n".join(candidates)
+    return frozenset(m.group(0) for m in _SHA256_LABEL_LINES.finditer(joined))
+
+
+@_instr.timed("verify_deterministic_is_canonicalizable")
 def verify_deterministic_is_canonicalizable(v: BehaviorV) -> None:
     """
     Verify that deterministic fields are canonicalizable.
@@ -167,10 +245,16 @@ def verify_deterministic_is_canonicalizable(v: BehaviorV) -> None:
     This is a fast-fail helper; canonicalization will also reject invalid values.
     """
     for idx, event in enumerate(v.events):
-        try:
-            canonicalize_value(event.deterministic_fields)
-        except CanonicalizationError as exc:
-            msg = str(exc)
-            raise CanonicalizationError(
-                f"deterministic_fields not canonicalizable; kind={event.kind.value} index={idx}"
-            ) from exc
+        _check_canonicalizable(event, idx)
+
+
+def _check_canonicalizable(event: DblEvent, idx: int) -> Any:
+    """
+    Return the canonical deterministic fields of event, or raise as the verifier does.
+    """
+    try:
+        return canonicalize_value(event.deterministic_fields)
+    except CanonicalizationError as exc:
+        raise CanonicalizationError(
+            f"deterministic_fields not canonicalizable; kind={event.kind.value} index={idx}"
+        ) from exc
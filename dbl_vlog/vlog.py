@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+from typing import Iterable
+
+from .exceptions import CanonicalizationError
+from .model import DblEvent
+from .v import BehaviorV
+
+
+class VLog:
+    """
+    Thread-safe appender for one logical stream V.
+
+    Appends from any number of threads (or asyncio tasks) are linearized by a
+    short critical section; the position returned by append() is t(e).
+    Pending events are published in batches as immutable BehaviorV snapshots,
+    and their event digests are computed once per batch outside the append lock.
+    Readers calling latest() never block writers.
+    """
+    __slots__ = (
+        "_append_lock",
+        "_publish_lock",
+        "_pending",
+        "_pending_digests",
+        "_base",
+        "_published",
+        "_digest_on_publish",
+    )
+
+    def __init__(self, v: BehaviorV | None = None, *, digest_on_publish: bool = True) -> None:
+        self._append_lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+        self._pending: list[DblEvent] = []
+        self._pending_digests: list[bytes | None] = []
+        self._published = v if v is not None else BehaviorV()
+        self._base = len(self._published)
+        self._digest_on_publish = digest_on_publish
+
+    def __len__(self) -> int:
+        with self._append_lock:
+            return self._base + len(self._pending)
+
+    def append(self, event: DblEvent) -> int:
+        """
+        Append event and return its stream index t(e).
+        """
+        return self._append_digested(event, None)
+
+    def extend(self, events: Iterable[DblEvent]) -> range:
+        """
+        Append events contiguously and return their stream indices.
+        """
+        batch = list(events)
+        for event in batch:
+            if not isinstance(event, DblEvent):
+                raise TypeError("event must be a DblEvent")
+        with self._append_lock:
+            start = self._base + len(self._pending)
+            self._pending.extend(batch)
+            self._pending_digests.extend([None] * len(batch))
+        return range(start, start + len(batch))
+
+    def _append_digested(self, event: DblEvent, digest: bytes | None) -> int:
+        """
+        append() with the event digest already computed by a trusted caller.
+        """
+        if not isinstance(event, DblEvent):
+            raise TypeError("event must be a DblEvent")
+        with self._append_lock:
+            idx = self._base + len(self._pending)
+            self._pending.append(event)
+            self._pending_digests.append(digest)
+        return idx
+
+    def latest(self) -> BehaviorV:
+        """
+        Most recently published snapshot, without publishing pending appends.
+        """
+        return self._published
+
+    def snapshot(self) -> BehaviorV:
+        """
+        Publish all pending appends and return the resulting immutable snapshot.
+        """
+        if not self._pending:
+            return self._published
+        with self._publish_lock:
+            with self._append_lock:
+                batch = self._pending
+                digests = self._pending_digests
+                self._pending = []
+                self._pending_digests = []
+                self._base += len(batch)
+            if batch:
+                v = self._published._extend_digested(tuple(batch), digests)
+                self._published = v
+                if self._digest_on_publish:
+                    try:
+                        v.event_digests()
+                    except (CanonicalizationError, UnicodeEncodeError, RecursionError):
+                        # Left to surface from v.digest(); V admits any DblEvent.
+                        pass
+            return self._published
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dbl_vlog import AsyncVLog, BehaviorV, CanonicalizationError, DblEvent, DblEventKind, event_digest
+
+
+def _event(i: int) -> DblEvent:
+    return DblEvent(kind=DblEventKind.INTENT, deterministic_fields={"i": i, "s": "x" * (i % 7)})
+
+
+def test_async_append_preserves_submission_order() -> None:
+    events = [_event(i) for i in range(200)]
+
+    async def main() -> tuple[list[int], BehaviorV, AsyncVLog]:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            async with AsyncVLog(executor=pool, max_pending=8) as alog:
+                positions = await asyncio.gather(*(alog.append(e) for e in events))
+                return positions, alog.snapshot(), alog
+
+    positions, v, alog = asyncio.run(main())
+    assert positions == list(range(200))
+    assert v.events == tuple(events)
+    assert v.event_digests() == [event_digest(e) for e in events]
+    assert v.digest() == BehaviorV(events=tuple(events)).digest()
+
+    stats = alog.stats()
+    assert stats.canonicalize.count == stats.hash.count == stats.commit.count == 200
+    assert stats.admission.count == 200
+    assert stats.total.max_s >= stats.total.mean_s > 0.0
+
+
+def test_rejected_event_is_not_appended() -> None:
+    async def main() -> BehaviorV:
+        alog = AsyncVLog()
+        assert await alog.append(_event(0)) == 0
+        with pytest.raises(CanonicalizationError):
+            await alog.append(DblEvent(kind=DblEventKind.INTENT, deterministic_fields={"x": 1.5}))
+        assert await alog.append(_event(1)) == 1
+        await alog.aclose()
+        return alog.snapshot()
+
+    v = asyncio.run(main())
+    assert v.events == (_event(0), _event(1))
+
+
+def test_max_pending_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        AsyncVLog(max_pending=0)
+
+
+def test_cancelled_executor_jobs_fail_their_appends() -> None:
+    async def main() -> None:
+        pool = ThreadPoolExecutor(max_workers=1)
+        gate = threading.Event()
+        pool.submit(gate.wait)
+        alog = AsyncVLog(executor=pool)
+        pending = [asyncio.ensure_future(alog.append(_event(i))) for i in range(3)]
+        await asyncio.sleep(0.01)
+        pool.shutdown(wait=False, cancel_futures=True)
+        gate.set()
+        results = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), 5)
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        assert alog._sequencer is not None and not alog._sequencer.done()
+        assert len(alog.snapshot()) == 0
+        await alog.aclose()
+
+    asyncio.run(main())
+
+
+def test_failed_scheduling_releases_slot() -> None:
+    async def main() -> None:
+        pool = ThreadPoolExecutor(max_workers=1)
+        pool.shutdown()
+        alog = AsyncVLog(executor=pool, max_pending=1)
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(alog.append(_event(0)), 5)
+        await alog.aclose()
+
+    asyncio.run(main())
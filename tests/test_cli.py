@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from dbl_vlog import BehaviorV, DblEvent, DblEventKind
+from dbl_vlog.cli import main
+
+H0 = "sha256:" + "0" * 64
+
+
+def _events(n: int) -> list[DblEvent]:
+    out: list[DblEvent] = []
+    for i in range(n):
+        corr = f"c-{i}"
+        out.append(
+            DblEvent(
+                kind=DblEventKind.INTENT,
+                deterministic_fields={
+                    "correlation_id": corr,
+                    "boundary_version": 1,
+                    "boundary_config_hash": H0,
+                    "input_digest": H0,
+                },
+                observational_fields={"received_at": f"t{i}"},
+            )
+        )
+        out.append(
+            DblEvent(kind=DblEventKind.DECISION, deterministic_fields={"correlation_id": corr, "policy_version": 1})
+        )
+        out.append(DblEvent(kind=DblEventKind.EXECUTION, deterministic_fields={"correlation_id": corr}))
+    return out
+
+
+def _write(path: Path, events: list[DblEvent], extra: list[str] = ()) -> Path:  # type: ignore[assignment]
+    lines = [
+        json.dumps(
+            {
+                "kind": e.kind.value,
+                "deterministic_fields": dict(e.deterministic_fields),
+                "observational_fields": dict(e.observational_fields),
+            }
+        )
+        for e in events
+    ]
+    path.write_text("\n".join(lines + list(extra)) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_cli_reports_v_digest(tmp_path: Path, capsys: pytest.CaptureFixture[str], jobs: int) -> None:
+    events = _events(50)
+    path = _write(tmp_path / "v.jsonl", events)
+    assert main([str(path), "--jobs", str(jobs), "--chunk-size", "7"]) == 0
+    captured = capsys.readouterr()
+    expected = BehaviorV(events=tuple(events)).digest_hex()
+    assert captured.out == f"ok events={len(events)} digest={expected}\n"
+    assert "ordering" in captured.err
+
+
+def test_cli_reports_first_violation(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    events = _events(5)
+    events.insert(4, DblEvent(kind=DblEventKind.PROOF, deterministic_fields={"correlation_id": "late"}))
+    events.append(DblEvent(kind=DblEventKind.DECISION, deterministic_fields={"correlation_id": "x"}))
+    path = _write(tmp_path / "v.jsonl", events)
+    assert main([str(path), "-q", "--chunk-size", "3"]) == 1
+    out = capsys.readouterr().out
+    assert out == (
+        "violation stage=ordering index=4 OrderingViolation: "
+        "PROOF observed before DECISION for correlation_id=late; index=4\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "line, stage",
+    [
+        ('{"kind": "INTENT", "deterministic_fields": {"x": 1.5}}', "canonicalize"),
+        ('{"kind": "DECISION", "deterministic_fields": {"correlation_id": "z"}}', "identity"),
+        ('{"kind": "EXECUTION", "deterministic_fields": {"correlation_id": "c-0", "output": 1}}', "digest"),
+        ("not json", "parse"),
+        ('{"kind": "BOGUS"}', "parse"),
+        ("[" * 100_000 + "]" * 100_000, "parse"),
+        ('{"kind": "EXECUTION", "deterministic_fields": {"correlation_id": "c-0", "s": "\\ud800"}}', "digest"),
+        ('{"kind": "INTENT", "deterministic_fields": {"x": ' + "[" * 900 + "]" * 900 + "}}", "canonicalize"),
+    ],
+)
+def test_cli_stage_violations(tmp_path: Path, capsys: pytest.CaptureFixture[str], line: str, stage: str) -> None:
+    path = _write(tmp_path / "v.jsonl", _events(2), [line])
+    assert main([str(path), "-q"]) == 1
+    assert capsys.readouterr().out.startswith(f"violation stage={stage} index=6 ")
+
+
+def test_cli_missing_file(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main([str(tmp_path / "missing.jsonl")]) == 2
+
+
+def test_cli_non_utf8_input(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "v.jsonl"
+    path.write_bytes(b'{"kind": "INTENT", "deterministic_fields": {"x": "\xff"}}\n')
+    assert main([str(path), "-q"]) == 2
+    assert "not valid UTF-8" in capsys.readouterr().err
+
+
+def test_cli_unrepresentable_input_with_jobs(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    line = '{"kind": "EXECUTION", "deterministic_fields": {"correlation_id": "c-0", "s": "\\ud800"}}'
+    path = _write(tmp_path / "v.jsonl", _events(2), [line])
+    assert main([str(path), "-q", "--jobs", "2", "--chunk-size", "2"]) == 1
+    assert capsys.readouterr().out.startswith("violation stage=digest index=6 CanonicalizationError: ")
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import pytest
+
+from dbl_vlog import (
+    BehaviorV,
+    ColumnarV,
+    DblEvent,
+    DblEventKind,
+    IdentityViolation,
+    OrderingViolation,
+    v_digest_buffer,
+    verify_identity_columns,
+    verify_identity_fields,
+    verify_ordering,
+    verify_ordering_columns,
+)
+
+H0 = "sha256:" + "0" * 64
+H1 = "sha256:" + "1" * 64
+
+
+def _intent(corr: object, **extra: object) -> DblEvent:
+    fields = {"correlation_id": corr, "boundary_version": 1, "boundary_config_hash": H0, "input_digest": H1}
+    fields.update(extra)
+    return DblEvent(kind=DblEventKind.INTENT, deterministic_fields=fields)
+
+
+def _decision(corr: object, **extra: object) -> DblEvent:
+    fields = {"correlation_id": corr, "policy_version": 1}
+    fields.update(extra)
+    return DblEvent(kind=DblEventKind.DECISION, deterministic_fields=fields)
+
+
+def _execution(corr: object) -> DblEvent:
+    return DblEvent(kind=DblEventKind.EXECUTION, deterministic_fields={"correlation_id": corr})
+
+
+def _valid_v() -> BehaviorV:
+    return BehaviorV(
+        events=(_intent("a"), _intent("b"), _decision("a"), _execution("a"), _decision("b"))
+    )
+
+
+def test_columnar_digest_and_round_trip() -> None:
+    v = _valid_v()
+    cv = ColumnarV.from_v(v)
+    assert len(cv) == len(v)
+    assert cv.digest() == v.digest()
+    assert cv.event_digests() == v.event_digests()
+    assert v_digest_buffer(cv.digests) == v.digest()
+    assert cv.to_v() == v
+    assert cv.kind_at(2) == DblEventKind.DECISION
+    assert cv.id_at(1) == "b"
+    assert len(cv.id_table) == 2
+
+
+def test_columnar_without_events_cannot_convert_back() -> None:
+    cv = ColumnarV.from_events(_valid_v().events)
+    assert cv.events is None
+    with pytest.raises(ValueError):
+        cv.to_v()
+
+
+def test_columnar_verifiers_accept_valid_stream() -> None:
+    cv = ColumnarV.from_v(_valid_v())
+    verify_ordering_columns(cv, require_intent_before_decision=True)
+    verify_identity_columns(cv)
+
+
+@pytest.mark.parametrize(
+    "events, kwargs",
+    [
+        ((_execution("a"),), {}),
+        ((_intent(""),), {}),
+        ((_intent(None),), {}),
+        ((_decision("a"),), {"require_intent_before_decision": True}),
+        ((_decision("a"), _execution("a"), _decision("a")), {"max_decisions_per_id": 0}),
+        ((_decision("a"), _decision("a")), {}),
+    ],
+)
+def test_columnar_ordering_matches_verify_ordering(events: tuple, kwargs: dict) -> None:
+    v = BehaviorV(events=events)
+    with pytest.raises(OrderingViolation) as expected:
+        verify_ordering(v, **kwargs)
+    with pytest.raises(OrderingViolation) as got:
+        verify_ordering_columns(ColumnarV.from_v(v), **kwargs)
+    assert str(got.value) == str(expected.value)
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        DblEvent(kind=DblEventKind.INTENT, deterministic_fields={"correlation_id": "c"}),
+        _intent("c", boundary_config_hash="banana"),
+        _intent("c", intent_digest="banana"),
+        _intent(7, input_digest="sha256:" + "g" * 64),
+        DblEvent(kind=DblEventKind.INTENT, deterministic_fields={"boundary_version": 1, "boundary_config_hash": H0}),
+        _decision("c", policy_digest="banana"),
+        DblEvent(kind=DblEventKind.DECISION, deterministic_fields={"correlation_id": "c"}),
+    ],
+)
+def test_columnar_identity_matches_verify_identity_fields(event: DblEvent) -> None:
+    v = BehaviorV(events=(_intent("ok"), event))
+    with pytest.raises(IdentityViolation) as expected:
+        verify_identity_fields(v)
+    with pytest.raises(IdentityViolation) as got:
+        verify_identity_columns(ColumnarV.from_v(v))
+    assert str(got.value) == str(expected.value)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+
+from dbl_vlog import (
+    BehaviorV,
+    DblEvent,
+    DblEventKind,
+    EventStore,
+    StoredV,
+    event_digest,
+    instrument,
+    verify_append_only,
+)
+
+
+def _decision(corr: str, ts: str) -> DblEvent:
+    return DblEvent(
+        kind=DblEventKind.DECISION,
+        deterministic_fields={"policy_version": 3, "outcome": "ALLOW", "scope": corr[:1]},
+        observational_fields={"decided_at": ts},
+    )
+
+
+def test_identical_deterministic_content_is_stored_once() -> None:
+    store = EventStore()
+    sv = StoredV(store=store)
+    for i in range(10):
+        sv = sv.append(_decision("c", f"2025-01-01T00:00:{i:02d}Z"))
+
+    assert len(sv) == 10
+    assert len(store) == 1
+    stats = store.stats()
+    assert stats.puts == 10
+    assert stats.unique == 1
+    assert stats.dedup_ratio == 10.0
+    assert stats.bytes_saved == 9 * stats.canonical_bytes_unique
+
+
+def test_stored_v_digest_matches_behavior_v() -> None:
+    events = [
+        _decision("a", "t0"),
+        DblEvent(kind=DblEventKind.INTENT, deterministic_fields={"i": 1}, observational_fields={"x": 1}),
+        _decision("a", "t1"),
+    ]
+    v = BehaviorV(events=tuple(events))
+    sv = StoredV.from_v(EventStore(), v)
+
+    assert sv.digest() == v.digest()
+    assert sv.event_digests() == v.event_digests()
+    assert sv.to_v() == v
+
+
+def test_per_position_observational_fields_are_kept() -> None:
+    sv = StoredV(store=EventStore()).append(_decision("a", "t0")).append(_decision("a", "t1"))
+    assert sv.refs[0] == sv.refs[1]
+    assert sv.at(0).observational_fields["decided_at"] == "t0"
+    assert sv.at(1).observational_fields["decided_at"] == "t1"
+
+
+def test_ref_is_event_digest() -> None:
+    store = EventStore()
+    e = _decision("a", "t0")
+    assert store.put(e) == event_digest(e)
+    with pytest.raises(KeyError):
+        store.get(b"\x00" * 32)
+
+
+def test_stored_content_is_canonical_regardless_of_first_variant() -> None:
+    decomposed = DblEvent(kind=DblEventKind.PROOF, deterministic_fields={"s": "e\u0301", "l": (1, 2)})
+    composed = DblEvent(kind=DblEventKind.PROOF, deterministic_fields={"s": "\u00e9", "l": [1, 2]})
+    v = BehaviorV(events=(decomposed, composed))
+    sv = StoredV.from_v(EventStore(), v)
+
+    assert sv.refs[0] == sv.refs[1]
+    assert sv.at(0) == sv.at(1) == composed
+    assert sv.to_v() == BehaviorV(events=(composed, composed))
+    assert sv.to_v().digest() == v.digest()
+    verify_append_only(sv.to_v(), sv.append(decomposed).to_v())
+
+    reversed_sv = StoredV.from_v(EventStore(), BehaviorV(events=(composed, decomposed)))
+    assert reversed_sv.to_v() == sv.to_v()
+
+
+def test_put_canonicalizes_once() -> None:
+    store = EventStore()
+    event = DblEvent(kind=DblEventKind.PROOF, deterministic_fields={"s": "e\u0301"})
+    instrument.enable()
+    instrument.reset()
+    try:
+        store.put(event)
+        store.put(event)
+        counters = instrument.snapshot().counters
+        assert counters["events_canonicalized"] == 2
+        assert counters["nfc_normalized"] == 2
+    finally:
+        instrument.disable()
+    assert store.get(event_digest(event)).deterministic_fields == {"s": "\u00e9"}
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from dbl_vlog import DblEvent, DblEventKind, FrozenFields, event_digest
+
+
+def test_frozen_fields_is_adopted_without_copy() -> None:
+    ff = FrozenFields({"correlation_id": "c-1", "a": 1})
+    e = DblEvent(kind=DblEventKind.INTENT, deterministic_fields=ff, observational_fields=ff)
+    assert e.deterministic_fields is ff
+    assert e.observational_fields is ff
+
+
+def test_same_shape_shares_key_layout() -> None:
+    a = FrozenFields({"x": 1, "y": 2})
+    b = FrozenFields({"x": 3, "y": 4})
+    assert a._layout is b._layout
+
+
+def test_equality_and_hash_follow_mapping_semantics() -> None:
+    a = FrozenFields({"x": 1, "y": 2})
+    b = FrozenFields({"y": 2, "x": 1})
+    assert a == b
+    assert a == {"x": 1, "y": 2}
+    assert hash(a) == hash(b)
+    assert a != FrozenFields({"x": 1})
+    with pytest.raises(TypeError):
+        hash(FrozenFields({"x": [1]}))
+
+
+def test_frozen_fields_is_read_only_and_picklable() -> None:
+    ff = FrozenFields({"x": 1})
+    with pytest.raises(TypeError):
+        ff["x"] = 2  # type: ignore[index]
+    assert pickle.loads(pickle.dumps(ff)) == ff
+    assert ff.get("missing", 7) == 7
+    assert "x" in ff and "y" not in ff
+
+
+def test_digest_is_independent_of_field_map_type() -> None:
+    fields = {"correlation_id": "c-1", "n": [1, 2], "s": "é"}
+    e_dict = DblEvent(kind=DblEventKind.DECISION, deterministic_fields=fields)
+    e_ff = DblEvent(kind=DblEventKind.DECISION, deterministic_fields=FrozenFields(fields))
+    assert e_dict == e_ff
+    assert event_digest(e_dict) == event_digest(e_ff)
+
+
+def test_adopted_frozen_fields_cannot_be_mutated() -> None:
+    ff = FrozenFields({"x": 1})
+    e = DblEvent(kind=DblEventKind.PROOF, deterministic_fields=ff)
+    before = event_digest(e)
+    ff.__init__({"x": 2})  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        ff._values = (2,)  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        ff._layout = FrozenFields({"y": 1})._layout  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        del ff._values
+    assert ff == {"x": 1}
+    assert event_digest(e) == before
+    assert hash(ff) == hash(FrozenFields({"x": 1}))
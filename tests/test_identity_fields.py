@@ -105,3 +105,35 @@ def test_input_digest_satisfies_identity_requirement() -> None:
         )
     )
     verify_identity_fields(v)
+
+
+def test_sha256_label_validation_is_ascii_hex_only() -> None:
+    from dbl_vlog.verify import _is_sha256_label, _valid_sha256_labels
+
+    upper = "sha256:" + "AB" * 32
+    arabic_digits = "sha256:" + "١" * 64
+    newline = "sha256:" + "0" * 32 + "\n" + "0" * 31
+    assert _is_sha256_label(upper)
+    assert not _is_sha256_label(arabic_digits)
+    assert not _is_sha256_label(newline)
+    assert not _is_sha256_label("sha256:" + "0" * 65)
+    assert _valid_sha256_labels([upper, arabic_digits, newline, None, 7]) == {upper}
+
+
+def test_identity_violation_reports_first_invalid_label_index() -> None:
+    ok = {
+        "correlation_id": "c-1",
+        "boundary_version": 1,
+        "boundary_config_hash": "sha256:" + "0" * 64,
+        "input_digest": "sha256:" + "1" * 64,
+    }
+    bad = dict(ok, input_digest="sha256:" + "x" * 64)
+    v = BehaviorV(
+        events=(
+            DblEvent(kind=DblEventKind.INTENT, deterministic_fields=ok),
+            DblEvent(kind=DblEventKind.INTENT, deterministic_fields=bad),
+        )
+    )
+    with pytest.raises(IdentityViolation) as exc:
+        verify_identity_fields(v)
+    assert str(exc.value) == "INTENT has invalid input_digest; correlation_id=c-1 index=1"
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from dbl_vlog import BehaviorV, DblEvent, DblEventKind, instrument, verify_ordering
+
+
+@pytest.fixture
+def instrumented() -> Iterator[None]:
+    instrument.reset()
+    instrument.enable()
+    try:
+        yield
+    finally:
+        instrument.disable()
+        instrument.reset()
+
+
+def _v() -> BehaviorV:
+    return BehaviorV(
+        events=(
+            DblEvent(kind=DblEventKind.DECISION, deterministic_fields={"correlation_id": "c-1", "s": "é"}),
+            DblEvent(kind=DblEventKind.EXECUTION, deterministic_fields={"correlation_id": "c-1"}),
+        )
+    )
+
+
+def test_disabled_instrumentation_records_nothing() -> None:
+    instrument.reset()
+    _v().digest()
+    assert not instrument.ACTIVE
+    assert all(n == 0 for n in instrument.snapshot().counters.values())
+
+
+def test_counters_and_verifier_timers(instrumented: None) -> None:
+    v = _v()
+    v.digest()
+    v.digest()
+    verify_ordering(v)
+
+    stats = instrument.snapshot()
+    c = stats.counters
+    assert c["events_canonicalized"] == 2
+    assert c["digest_cache_misses"] == 2
+    assert c["digest_cache_hits"] == 2
+    assert c["nfc_normalized"] >= 1
+    assert c["nfc_skipped"] >= 1
+    assert c["bytes_hashed"] > 2 * 40
+    assert stats.timers["verify_ordering"].count == 1
+    assert stats.timers["verify_ordering"].total_s >= 0.0
+
+
+def test_hooks_receive_samples_and_cannot_affect_digests(instrumented: None) -> None:
+    expected = _v().digest()
+    seen: list[tuple[str, float]] = []
+
+    def failing_hook(name: str, value: float) -> None:
+        seen.append((name, value))
+        raise RuntimeError("metrics backend down")
+
+    instrument.add_hook(failing_hook)
+    try:
+        assert _v().digest() == expected
+    finally:
+        instrument.remove_hook(failing_hook)
+    assert ("events_canonicalized", 1) in seen
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+from dbl_vlog import (
+    BehaviorV,
+    DblEvent,
+    DblEventKind,
+    ObservationalIndex,
+    VLog,
+    project_normative,
+    select,
+)
+
+
+def _event(kind: DblEventKind, corr: str, **obs: object) -> DblEvent:
+    return DblEvent(kind=kind, deterministic_fields={"correlation_id": corr}, observational_fields=obs)
+
+
+def _stream() -> BehaviorV:
+    return BehaviorV(
+        events=(
+            _event(DblEventKind.INTENT, "a", received_at="2026-01-01T00:00:01Z", host="h1"),
+            _event(DblEventKind.DECISION, "a", decided_at="2026-01-01T00:00:05Z", host="h1"),
+            _event(DblEventKind.INTENT, "b", received_at="2026-01-01T00:00:02Z", host="h2"),
+            _event(DblEventKind.DECISION, "b", decided_at="2026-01-01T00:00:03Z", host="h2"),
+            _event(DblEventKind.EXECUTION, "a", decided_at="2026-01-01T00:00:04Z", host=1),
+            _event(DblEventKind.DECISION, "c", decided_at=17, host=["unhashable"]),
+        )
+    )
+
+
+def _scan(v: BehaviorV, key: str, lo: str, hi: str, kind: DblEventKind | None) -> tuple[int, ...]:
+    return tuple(
+        i for i, e in enumerate(v.events)
+        if (kind is None or e.kind == kind)
+        and isinstance(e.observational_fields.get(key), str)
+        and lo <= e.observational_fields[key] < hi
+    )
+
+
+def test_range_query_matches_full_scan() -> None:
+    v = _stream()
+    index = ObservationalIndex.build(v, range_keys=("decided_at", "received_at"))
+    lo, hi = "2026-01-01T00:00:03Z", "2026-01-01T00:00:06Z"
+    assert index.range("decided_at", lo, hi, kind=DblEventKind.DECISION) == (1, 3)
+    assert index.range("decided_at", lo, hi) == _scan(v, "decided_at", lo, hi, None) == (1, 3, 4)
+    assert index.range("decided_at", lo, "2026-01-01T00:00:05Z") == (3, 4)
+    assert index.range("decided_at") == (1, 3, 4)
+    assert index.range("received_at", kind=DblEventKind.DECISION) == ()
+    assert [e.deterministic_fields["correlation_id"] for e in select(v, (1, 3))] == ["a", "b"]
+
+
+def test_equality_query_is_type_exact() -> None:
+    index = ObservationalIndex.build(_stream(), eq_keys=("host",))
+    assert index.equal("host", "h1") == (0, 1)
+    assert index.equal("host", "h2", kind=DblEventKind.DECISION) == (3,)
+    assert index.equal("host", 1) == (4,)
+    assert index.equal("host", True) == ()
+    assert index.of_kind(DblEventKind.DECISION) == (1, 3, 5)
+    with pytest.raises(KeyError):
+        index.equal("decided_at", "x")
+    with pytest.raises(KeyError):
+        index.range("host")
+
+
+def test_incremental_update_from_vlog() -> None:
+    events = _stream().events
+    log = VLog()
+    index = ObservationalIndex(range_keys=("decided_at",))
+    for event in events[:3]:
+        log.append(event)
+    assert index.update(log.snapshot()) == 3
+    for event in events[3:]:
+        log.append(event)
+    assert index.update(log.snapshot()) == 3
+    assert len(index) == 6
+    assert index.range("decided_at") == ObservationalIndex.build(
+        log.snapshot(), range_keys=("decided_at",)
+    ).range("decided_at")
+    with pytest.raises(ValueError):
+        index.update(BehaviorV(events=events[:2]))
+
+
+def test_index_does_not_affect_digests_or_projection() -> None:
+    v = _stream()
+    digest, event_digests = v.digest(), v.event_digests()
+    norm = project_normative(v)
+    norm_digest = norm.digest()
+    ObservationalIndex.build(v, eq_keys=("host",), range_keys=("decided_at",))
+    assert v.digest() == digest
+    assert v.event_digests() == event_digests
+    assert project_normative(v) == norm
+    assert project_normative(v).digest() == norm_digest
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dbl_vlog import (
+    AppendOnlyViolation,
+    BehaviorV,
+    DblEvent,
+    DblEventKind,
+    OrderingViolation,
+    PartitionedV,
+    PartitionedVLog,
+    PartitionViolation,
+    partitioned_root_digest,
+    shard_of,
+    verify_ordering,
+    verify_partitioned,
+    verify_partitioned_append_only,
+)
+
+
+def _lifecycle(corr: str) -> list[DblEvent]:
+    return [
+        DblEvent(kind=DblEventKind.DECISION, deterministic_fields={"correlation_id": corr}),
+        DblEvent(kind=DblEventKind.EXECUTION, deterministic_fields={"correlation_id": corr}),
+    ]
+
+
+def _events(n: int) -> list[DblEvent]:
+    return [e for i in range(n) for e in _lifecycle(f"c-{i}")]
+
+
+def test_routing_is_stable_and_nfc_normalized() -> None:
+    assert shard_of("café", 8) == shard_of("café", 8)
+    expected = int.from_bytes(hashlib.sha256(b"c-1").digest()[:8], "big") % 5
+    assert shard_of("c-1", 5) == expected
+    with pytest.raises(ValueError):
+        shard_of("c-1", 0)
+
+
+def test_partitioned_v_verifies_and_merges() -> None:
+    events = _events(40)
+    pv = PartitionedV.from_events(events, 4)
+    assert len(pv) == len(events)
+    assert all(len(s) for s in pv.shards)
+    verify_partitioned(pv)
+    merged = pv.merged()
+    verify_ordering(merged)
+    assert sorted(map(id, merged.events)) == sorted(map(id, events))
+
+
+def test_root_digest_commits_to_shards() -> None:
+    pv = PartitionedV.from_events(_events(20), 3)
+    root = pv.root_digest()
+    assert root == partitioned_root_digest([s.digest() for s in pv.shards], [len(s) for s in pv.shards])
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        assert pv.root_digest(executor=pool) == root
+    assert PartitionedV.from_events(_events(20), 4).root_digest() != root
+    grown = pv.append(_lifecycle("c-new")[0])
+    assert grown.root_digest() != root
+    verify_partitioned_append_only(pv, grown)
+
+
+def test_misrouted_event_is_rejected() -> None:
+    pv = PartitionedV.from_events(_events(10), 2)
+    event = pv.shards[0].at(0)
+    tampered = PartitionedV(shards=(pv.shards[0], pv.shards[1].append(event)))
+    with pytest.raises(PartitionViolation):
+        verify_partitioned(tampered)
+
+
+def test_shard_ordering_violation_names_shard() -> None:
+    bad = DblEvent(kind=DblEventKind.EXECUTION, deterministic_fields={"correlation_id": "orphan"})
+    pv = PartitionedV.empty(3).append(bad)
+    with pytest.raises(OrderingViolation, match=f"shard={shard_of('orphan', 3)}: "):
+        verify_partitioned(pv)
+
+
+def test_append_only_across_partitionings() -> None:
+    with pytest.raises(PartitionViolation):
+        verify_partitioned_append_only(PartitionedV.empty(2), PartitionedV.empty(3))
+    a = PartitionedV.from_events(_events(6), 2)
+    b = PartitionedV.from_events(_events(6)[::-1], 2)
+    with pytest.raises(AppendOnlyViolation):
+        verify_partitioned_append_only(a, b)
+
+
+def test_concurrent_partitioned_appends() -> None:
+    log = PartitionedVLog(4)
+
+    def produce(p: int) -> None:
+        for i in range(50):
+            for e in _lifecycle(f"p{p}-{i}"):
+                log.append(e)
+
+    threads = [threading.Thread(target=produce, args=(p,)) for p in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    pv = log.snapshot()
+    assert len(pv) == len(log) == 400
+    verify_partitioned(pv)
+    assert isinstance(pv.merged(), BehaviorV)
+
+
+def test_append_does_not_touch_other_shards(monkeypatch: pytest.MonkeyPatch) -> None:
+    from dbl_vlog.vlog import VLog
+
+    log = PartitionedVLog(4)
+    pv = PartitionedV.empty(4)
+    events = _lifecycle("c-1")
+
+    def no_len(self: object) -> int:
+        raise AssertionError("append must not take every shard lock")
+
+    monkeypatch.setattr(VLog, "__len__", no_len)
+    monkeypatch.setattr(PartitionedV, "__len__", no_len)
+    for e in events:
+        log.append(e)
+        pv = pv.append(e)
+    monkeypatch.undo()
+
+    missing = DblEvent(kind=DblEventKind.INTENT, deterministic_fields={})
+    with pytest.raises(OrderingViolation, match=f"index={len(events)}"):
+        log.append(missing)
+    with pytest.raises(OrderingViolation, match=f"index={len(events)}"):
+        pv.append(missing)
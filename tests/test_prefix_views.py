@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from dbl_vlog import BehaviorV, DblEvent, DblEventKind, VPrefix, v_digest
+from dbl_vlog.v import CHECKPOINT_INTERVAL
+
+
+def _v(n: int) -> BehaviorV:
+    return BehaviorV(
+        events=tuple(
+            DblEvent(kind=DblEventKind.INTENT, deterministic_fields={"i": i}) for i in range(n)
+        )
+    )
+
+
+def test_prefix_digest_matches_rebuilt_v() -> None:
+    v = _v(2 * CHECKPOINT_INTERVAL + 7)
+    for n in (0, 1, CHECKPOINT_INTERVAL - 1, CHECKPOINT_INTERVAL, CHECKPOINT_INTERVAL + 3, len(v)):
+        expected = BehaviorV(events=v.events[:n]).digest()
+        assert v.prefix(n).digest() == expected
+        assert v[:n].digest() == expected
+        assert v_digest(v.event_digests()[:n]) == expected
+
+
+def test_prefix_view_shares_parent_storage() -> None:
+    v = _v(10)
+    p = v[:4]
+    assert isinstance(p, VPrefix)
+    assert p.parent is v
+    assert len(p) == 4
+    assert list(p) == list(v.events[:4])
+    assert p.at(-1) == v.at(3)
+    with pytest.raises(IndexError):
+        p.at(4)
+    with pytest.raises(IndexError):
+        v.prefix(11)
+
+
+def test_non_prefix_slice_is_reindexed_v() -> None:
+    v = _v(6)
+    tail = v[2:5]
+    assert isinstance(tail, BehaviorV)
+    assert tail.events == v.events[2:5]
+    assert tail.digest() == BehaviorV(events=v.events[2:5]).digest()
+    assert v[1] == v.at(1)
+
+
+def test_append_after_prefix_does_not_corrupt_cache() -> None:
+    v = _v(CHECKPOINT_INTERVAL + 5)
+    v.digest()
+    extra = DblEvent(kind=DblEventKind.DECISION, deterministic_fields={"x": 1})
+    branched = v.prefix(3).to_v().append(extra)
+    assert branched.digest() == BehaviorV(events=v.events[:3] + (extra,)).digest()
+    assert v.digest() == BehaviorV(events=v.events).digest()
+
+
+def test_behavior_v_pickles_without_cache() -> None:
+    v = _v(3)
+    v.digest()
+    restored = pickle.loads(pickle.dumps(v))
+    assert restored == v
+    assert restored.digest() == v.digest()
+
+
+def test_prefix_view_supports_indexing_and_slicing() -> None:
+    v = _v(10)
+    p = v[:6]
+    assert p[0] == v[0]
+    assert p[-1] == v[5]
+    with pytest.raises(IndexError):
+        p[6]
+    with pytest.raises(IndexError):
+        p[-7]
+    q = p[:4]
+    assert isinstance(q, VPrefix) and q.parent is v and len(q) == 4
+    assert isinstance(p[:100], VPrefix) and len(p[:100]) == 6
+    assert p[:-2].digest() == BehaviorV(events=v.events[:4]).digest()
+    r = p[2:5]
+    assert isinstance(r, BehaviorV)
+    assert r.events == v.events[2:5]
+    assert p[::-1].events == v.events[5::-1]
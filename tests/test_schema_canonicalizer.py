@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import pytest
+
+from dbl_vlog import (
+    CanonicalizationError,
+    CompiledCanonicalizer,
+    DblEvent,
+    DblEventKind,
+    EventSchema,
+    event_canonical_bytes,
+    event_digest,
+    infer_schema,
+    instrument,
+    register_schema,
+    registered_schema,
+    unregister_schema,
+)
+
+H0 = "sha256:" + "0" * 64
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    yield
+    for kind in DblEventKind:
+        unregister_schema(kind)
+
+
+def _intent(**fields: object) -> DblEvent:
+    base = {"correlation_id": "c1", "boundary_version": 1, "boundary_config_hash": H0}
+    base.update(fields)
+    return DblEvent(kind=DblEventKind.INTENT, deterministic_fields=base)
+
+
+def _generic(event: DblEvent, **kw: bool) -> bytes:
+    unregister_schema(event.kind)
+    return event_canonical_bytes(event, **kw)
+
+
+def test_compiled_output_is_byte_identical() -> None:
+    events = [
+        _intent(),
+        _intent(correlation_id="Café", boundary_version=-7),
+        _intent(correlation_id="é\"\\\n\t\x01 ", boundary_version=10**30),
+    ]
+    schema = infer_schema(events)
+    compiled = CompiledCanonicalizer(schema)
+    for event in events:
+        assert compiled(event) == _generic(event)
+
+
+def test_registered_schema_drives_event_digest() -> None:
+    event = _intent(correlation_id="résumé")
+    expected_bytes = event_canonical_bytes(event)
+    expected_digest = event_digest(event)
+    register_schema(infer_schema([event]))
+    assert registered_schema(DblEventKind.INTENT) is not None
+    instrument.enable()
+    instrument.reset()
+    try:
+        assert event_canonical_bytes(event) == expected_bytes
+        assert event_digest(event) == expected_digest
+        assert instrument.snapshot().counters["events_canonicalized"] == 2
+    finally:
+        instrument.disable()
+
+
+def test_unicode_keys_sorted_after_normalization() -> None:
+    fields = {"é": "x", "è": "y", "z": None, "a": True}
+    event = DblEvent(kind=DblEventKind.PROOF, deterministic_fields=fields)
+    compiled = CompiledCanonicalizer(infer_schema([event]))
+    assert compiled(event) == _generic(event)
+
+
+def test_nfc_key_collision_rejected() -> None:
+    schema = EventSchema(kind=DblEventKind.PROOF, fields={"é": str, "é": str})
+    with pytest.raises(ValueError):
+        CompiledCanonicalizer(schema)
+
+
+def test_object_fields_use_generic_encoding() -> None:
+    event = _intent(extra={"b": [1, "é", None], "a": {"y": False}})
+    schema = infer_schema([event])
+    assert schema.fields["extra"] == (object,)
+    assert CompiledCanonicalizer(schema)(event) == _generic(event)
+
+
+def test_mismatch_falls_back_to_generic() -> None:
+    compiled = register_schema(infer_schema([_intent()]))
+    mismatches = [
+        _intent(boundary_version=True),
+        _intent(boundary_version="1"),
+        _intent(extra=1),
+        DblEvent(kind=DblEventKind.INTENT, deterministic_fields={"correlation_id": "c1"}),
+        DblEvent(kind=DblEventKind.DECISION, deterministic_fields={"correlation_id": "c1"}),
+    ]
+    for event in mismatches:
+        assert compiled(event) is None
+        assert event_canonical_bytes(event) == _generic(event)
+        register_schema(compiled.schema)
+
+
+def test_generic_errors_are_preserved() -> None:
+    register_schema(
+        EventSchema(kind=DblEventKind.DECISION, fields={"correlation_id": str, "extra": object, "timing": int})
+    )
+    with pytest.raises(CanonicalizationError, match="forbidden key"):
+        event_canonical_bytes(
+            DblEvent(kind=DblEventKind.DECISION, deterministic_fields={"correlation_id": "c", "extra": 1, "timing": 1})
+        )
+    event = DblEvent(
+        kind=DblEventKind.DECISION,
+        deterministic_fields={"correlation_id": "c", "extra": [1.5], "timing": 1},
+    )
+    with pytest.raises(CanonicalizationError, match="floats"):
+        event_canonical_bytes(event, enforce_keys=False)
+
+    register_schema(EventSchema(kind=DblEventKind.PROOF, fields={"n": int}))
+    huge = DblEvent(kind=DblEventKind.PROOF, deterministic_fields={"n": 10**5000})
+    with pytest.raises(CanonicalizationError):
+        event_canonical_bytes(huge)
+    with pytest.raises(CanonicalizationError):
+        event_digest(huge)
+
+
+def test_infer_schema_rejects_mixed_shapes() -> None:
+    with pytest.raises(ValueError):
+        infer_schema([])
+    with pytest.raises(ValueError):
+        infer_schema([_intent(), _intent(extra=1)])
+    with pytest.raises(ValueError):
+        infer_schema([_intent(), DblEvent(kind=DblEventKind.PROOF, deterministic_fields={})])
+    assert infer_schema([_intent(extra=None), _intent(extra="x")]).fields["extra"] == (str, type(None))
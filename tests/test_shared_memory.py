@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from dbl_vlog import (
+    BehaviorV,
+    DblEvent,
+    DblEventKind,
+    attach_shared,
+    publish_shared,
+    verify_ordering,
+)
+
+
+def _v() -> BehaviorV:
+    v = BehaviorV()
+    for i in range(20):
+        corr = f"c-{i}"
+        v = v.append(
+            DblEvent(
+                kind=DblEventKind.DECISION,
+                deterministic_fields={"correlation_id": corr, "policy_version": 1, "tags": ["a", "é"]},
+                observational_fields={"decided_at": f"2025-01-01T00:00:{i:02d}Z", "load": 0.5},
+            )
+        ).append(
+            DblEvent(kind=DblEventKind.EXECUTION, deterministic_fields={"correlation_id": corr})
+        )
+    return v
+
+
+def test_attached_view_matches_published_v() -> None:
+    v = _v()
+    with publish_shared(v) as segment:
+        with attach_shared(segment.name) as sv:
+            assert len(sv) == len(v)
+            assert sv.digest() == v.digest()
+            assert sv.event_digests() == v.event_digests()
+            assert sv.event_digest_at(-1) == v.event_digests()[-1]
+            assert sv.at(3) == v.at(3)
+            assert sv[-1] == v.at(len(v) - 1)
+            assert sv.events == v.events
+            verify_ordering(sv)  # type: ignore[arg-type]
+            restored = sv.to_v()
+            assert restored == v
+            assert restored.digest() == v.digest()
+            with pytest.raises(IndexError):
+                sv.at(len(v))
+
+
+def test_empty_v_round_trips() -> None:
+    with publish_shared(BehaviorV()) as segment:
+        with attach_shared(segment.name) as sv:
+            assert len(sv) == 0
+            assert sv.digest() == BehaviorV().digest()
+
+
+def test_attach_rejects_foreign_segment() -> None:
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            attach_shared(shm.name)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+_CROSS_PROCESS_SCRIPT = """
+import multiprocessing as mp
+import sys
+
+from dbl_vlog import BehaviorV, DblEvent, DblEventKind, attach_shared, publish_shared
+
+
+def worker(name, expected, results):
+    with attach_shared(name) as sv:
+        results.put(sv.digest().hex() == expected and len(sv.events) == 3)
+
+
+if __name__ == "__main__":
+    ctx = mp.get_context(sys.argv[1])
+    v = BehaviorV()
+    for i in range(3):
+        v = v.append(DblEvent(kind=DblEventKind.INTENT, deterministic_fields={"correlation_id": f"c-{i}"}))
+    segment = publish_shared(v)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(segment.name, v.digest_hex(), results)) for _ in range(2)]
+    for p in procs:
+        p.start()
+    oks = [results.get(timeout=60) for _ in procs]
+    for p in procs:
+        p.join(60)
+    segment.close()
+    segment.unlink()
+    assert oks == [True, True], oks
+    assert all(p.exitcode == 0 for p in procs)
+"""
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    root = str(Path(__file__).resolve().parents[1])
+    env["PYTHONPATH"] = root + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+@pytest.mark.parametrize("method", ["spawn", "fork"])
+def test_workers_attach_across_processes(method: str, tmp_path: Path) -> None:
+    if method not in mp.get_all_start_methods():
+        pytest.skip(f"start method {method!r} not available")
+    script = tmp_path / "publisher.py"
+    script.write_text(_CROSS_PROCESS_SCRIPT, encoding="utf-8")
+    proc = subprocess.run(
+        [sys.executable, str(script), method],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "Traceback" not in proc.stderr
+    assert "leaked" not in proc.stderr
+
+
+def test_unrelated_process_does_not_take_ownership() -> None:
+    v = _v()
+    with publish_shared(v) as segment:
+        code = (
+            "import sys\nfrom dbl_vlog import attach_shared\n"
+            "with attach_shared(sys.argv[1]) as sv:\n    print(sv.digest_hex())\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code, segment.name],
+            capture_output=True,
+            text=True,
+            env=_env(),
+            timeout=120,
+        )
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip() == v.digest_hex()
+        assert "leaked" not in proc.stderr
+        with attach_shared(segment.name) as sv:
+            assert sv.digest() == v.digest()
+
+
+def test_unrelated_process_rejecting_foreign_segment_leaves_it_alone() -> None:
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        code = (
+            "import sys\nfrom dbl_vlog import attach_shared\n"
+            "try:\n    attach_shared(sys.argv[1])\nexcept ValueError:\n    print('rejected')\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code, shm.name],
+            capture_output=True,
+            text=True,
+            env=_env(),
+            timeout=120,
+        )
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip() == "rejected"
+        assert "leaked" not in proc.stderr
+        again = shared_memory.SharedMemory(name=shm.name)
+        again.close()
+    finally:
+        shm.close()
+        shm.unlink()
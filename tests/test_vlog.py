@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from dbl_vlog import BehaviorV, CanonicalizationError, DblEvent, DblEventKind, VLog
+
+
+def _event(producer: int, i: int) -> DblEvent:
+    return DblEvent(kind=DblEventKind.INTENT, deterministic_fields={"p": producer, "i": i})
+
+
+def test_concurrent_appends_are_linearized() -> None:
+    log = VLog()
+    positions: dict[tuple[int, int], int] = {}
+
+    def produce(p: int) -> None:
+        for i in range(200):
+            positions[(p, i)] = log.append(_event(p, i))
+
+    threads = [threading.Thread(target=produce, args=(p,)) for p in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    v = log.snapshot()
+    assert len(v) == len(log) == 1600
+    assert sorted(positions.values()) == list(range(1600))
+    for (p, i), idx in positions.items():
+        assert v.at(idx).deterministic_fields == {"p": p, "i": i}
+    for p in range(8):
+        own = [positions[(p, i)] for i in range(200)]
+        assert own == sorted(own)
+    assert v.digest() == BehaviorV(events=v.events).digest()
+
+
+def test_snapshots_are_isolated() -> None:
+    log = VLog()
+    log.append(_event(0, 0))
+    s1 = log.snapshot()
+    log.extend([_event(0, 1), _event(0, 2)])
+    assert log.latest() is s1
+    s2 = log.snapshot()
+    assert len(s1) == 1
+    assert len(s2) == 3
+    assert s2.events[:1] == s1.events
+    assert log.snapshot() is s2
+
+
+def test_extend_returns_contiguous_positions() -> None:
+    log = VLog(BehaviorV().append(_event(0, 0)))
+    assert log.extend([_event(1, 0), _event(1, 1)]) == range(1, 3)
+    assert log.append(_event(2, 0)) == 3
+    with pytest.raises(TypeError):
+        log.append("not an event")  # type: ignore[arg-type]
+
+
+def test_non_canonicalizable_event_is_published_and_fails_on_digest() -> None:
+    log = VLog()
+    log.append(DblEvent(kind=DblEventKind.INTENT, deterministic_fields={"x": 1.5}))
+    v = log.snapshot()
+    assert len(v) == 1
+    with pytest.raises(CanonicalizationError):
+        v.digest()
+
+
+def _deep(depth: int) -> list[object]:
+    value: list[object] = []
+    for _ in range(depth):
+        value = [value]
+    return value
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [("\ud800", UnicodeEncodeError), (_deep(5000), RecursionError)],
+    ids=["lone-surrogate", "deep-nesting"],
+)
+def test_undigestable_event_does_not_break_snapshot(value: object, error: type[Exception]) -> None:
+    log = VLog()
+    log.append(DblEvent(kind=DblEventKind.INTENT, deterministic_fields={"x": value}))
+    v = log.snapshot()
+    assert len(v) == 1
+    assert log.snapshot() is v
+    log.append(_event(0, 0))
+    assert len(log.snapshot()) == 2
+    with pytest.raises(error):
+        v.digest()